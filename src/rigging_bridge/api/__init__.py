@@ -1,13 +1,26 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
 from rigging_bridge.api.v1 import router as v1_router
 from rigging_bridge.config import get_settings
+from rigging_bridge.services.conversion import ConversionService
+from rigging_bridge.services.jobs import JobRegistry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    app.state.conversion_service.close()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    app.state.conversion_service = ConversionService(settings)
+    app.state.job_registry = JobRegistry()
     app.include_router(v1_router, prefix="/v1")
     return app
 
@@ -1,15 +1,25 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.concurrency import run_in_threadpool
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 
 from rigging_bridge.api.v1.models import (
     ConversionRequest,
     ConversionResponse,
 )
 from rigging_bridge.services.conversion import BlenderConversionError, ConversionService
+from rigging_bridge.services.jobs import JobRegistry
 
 router = APIRouter()
 
 
+def get_service(request: Request) -> ConversionService:
+    """Return the conversion service shared by the application."""
+    return request.app.state.conversion_service
+
+
+def get_job_registry(request: Request) -> JobRegistry:
+    """Return the application's background job registry."""
+    return request.app.state.job_registry
+
+
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health() -> dict[str, str]:
     """Simple liveness probe."""
@@ -17,12 +27,33 @@ async def health() -> dict[str, str]:
 
 
 @router.post("/convert", response_model=ConversionResponse, status_code=status.HTTP_202_ACCEPTED)
-async def convert(request: ConversionRequest) -> ConversionResponse:
+async def convert(
+    request: ConversionRequest,
+    background_tasks: BackgroundTasks,
+    service: ConversionService = Depends(get_service),
+    registry: JobRegistry = Depends(get_job_registry),
+) -> ConversionResponse:
     """Run the Blender-based rig conversion pipeline."""
-    service = ConversionService()
+    if not request.wait:
+        job_id = registry.create()
+        background_tasks.add_task(service.run_job, job_id, request, registry)
+        return registry.get(job_id)
+
     try:
-        return await run_in_threadpool(service.convert, request)
+        return await service.convert_async(request)
     except (FileNotFoundError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except BlenderConversionError as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
+
+
+@router.get("/status/{job_id}", response_model=ConversionResponse)
+async def job_status(
+    job_id: str,
+    registry: JobRegistry = Depends(get_job_registry),
+) -> ConversionResponse:
+    """Report the state of a conversion submitted with ``wait=false``."""
+    response = registry.get(job_id)
+    if response is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job: {job_id}")
+    return response
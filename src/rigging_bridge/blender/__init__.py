@@ -2,4 +2,7 @@
 
 from importlib.resources import files
 
-__all__ = ["files"]
+# Line prefix a server-mode worker prints before its JSON job result
+WORKER_RESULT_PREFIX = "@@rig-transformer-result@@"
+
+__all__ = ["WORKER_RESULT_PREFIX", "files"]
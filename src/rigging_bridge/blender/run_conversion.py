@@ -1,5 +1,9 @@
 import argparse
+import json
+import logging
+import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add the source directory to Python path for local development
@@ -11,6 +15,7 @@ if src_path not in [Path(p) for p in sys.path]:
 import bpy
 from importlib import resources
 
+from rigging_bridge.blender import WORKER_RESULT_PREFIX
 from rigging_bridge.blender import arp_to_ue5_glb_converter as converter
 
 
@@ -28,10 +33,15 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--skip-t-pose", action="store_true")
     parser.add_argument("--skip-textures", action="store_true")
     parser.add_argument("--keep-fingers", action="store_true")
+    parser.add_argument(
+        "--append-armature",
+        action="store_true",
+        help="Fully append the UE5 armature instead of linking it from the bundled library",
+    )
     return parser.parse_args(argv)
 
 
-def _append_ue5_armature() -> None:
+def _append_ue5_armature(linked: bool = True) -> None:
     if "root" in bpy.data.objects:
         return
 
@@ -40,7 +50,7 @@ def _append_ue5_armature() -> None:
         if not blend_path.exists():
             raise FileNotFoundError(f"UE5 armature asset missing: {blend_path}")
 
-        with bpy.data.libraries.load(str(blend_path), link=False) as (data_from, data_to):
+        with bpy.data.libraries.load(str(blend_path), link=linked) as (data_from, data_to):
             if "root" not in data_from.objects:
                 raise RuntimeError("UE5 armature file does not contain an object named 'root'")
             data_to.objects = ["root"]
@@ -48,12 +58,22 @@ def _append_ue5_armature() -> None:
         for obj in data_to.objects:
             if obj is None:
                 continue
+            if linked:
+                # Linked IDs are read-only. Localise only the object and its armature
+                # data so the converter can edit bones, without appending the rest of
+                # the library's dependency graph.
+                obj = obj.make_local()
+                obj.data = obj.data.make_local()
             bpy.context.scene.collection.objects.link(obj)
             obj.hide_viewport = False
             obj.hide_set(False)
 
 
-def _import_source_asset(path: Path) -> None:
+def _import_source_asset(path: Path) -> list[bpy.types.Object]:
+    """Import the source asset and return the objects it added to the scene."""
+    # Compare by name: object references do not survive open_mainfile
+    existing = set(bpy.data.objects.keys())
+
     suffix = path.suffix.lower()
     if suffix in {".glb", ".gltf"}:
         bpy.ops.import_scene.gltf(filepath=str(path))
@@ -64,12 +84,17 @@ def _import_source_asset(path: Path) -> None:
     else:
         raise ValueError(f"Unsupported input type: {path.suffix}")
 
+    return [obj for name, obj in bpy.data.objects.items() if name not in existing]
 
-def _find_source_armature() -> bpy.types.Object:
-    for obj in bpy.data.objects:
-        if obj.type == "ARMATURE" and obj.name != "root":
-            return obj
-    raise RuntimeError("Unable to locate source armature in scene")
+
+def _find_source_armature(candidates: list[bpy.types.Object]) -> bpy.types.Object:
+    armature = next(
+        (obj for obj in candidates if obj.type == "ARMATURE" and obj.name != "root"),
+        None,
+    )
+    if armature is None:
+        raise RuntimeError("Unable to locate source armature in scene")
+    return armature
 
 
 def main(argv: list[str]) -> None:
@@ -82,11 +107,11 @@ def main(argv: list[str]) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     bpy.ops.wm.read_factory_settings(use_empty=True)
-    _import_source_asset(input_path)
+    imported_objects = _import_source_asset(input_path)
 
-    _append_ue5_armature()
+    _append_ue5_armature(linked=not args.append_armature)
 
-    armature = _find_source_armature()
+    armature = _find_source_armature(imported_objects)
     bpy.context.view_layer.objects.active = armature
     bpy.ops.object.select_all(action="DESELECT")
     armature.select_set(True)
@@ -104,5 +129,48 @@ def main(argv: list[str]) -> None:
     )
 
 
+def serve(stdin=sys.stdin, stdout=sys.stdout) -> None:
+    """Run conversions for JSON jobs read line by line from stdin.
+
+    Each job is ``{"argv": [...], "cwd": "..."}``, where argv holds the same
+    arguments accepted after ``--`` on the command line. Once a job finishes a
+    single ``WORKER_RESULT_PREFIX``-tagged JSON line reports its status, and
+    the scene is reset so the next job starts from an empty file.
+    """
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        status = 0
+        error = None
+        try:
+            job = json.loads(line)
+            if job.get("cwd"):
+                os.chdir(job["cwd"])
+            main(job["argv"])
+        except SystemExit as exc:  # argparse errors
+            status = exc.code if isinstance(exc.code, int) else 1
+            error = None if status == 0 else f"Invalid job arguments: {exc.code}"
+        except Exception as exc:  # noqa: BLE001 - report any failure back to the caller
+            traceback.print_exc(file=stdout)
+            status = 1
+            error = str(exc)
+        finally:
+            bpy.ops.wm.read_factory_settings(use_empty=True)
+
+        stdout.write(f"{WORKER_RESULT_PREFIX}{json.dumps({'status': status, 'error': error})}\n")
+        stdout.flush()
+
+
 if __name__ == "__main__":  # pragma: no cover - Blender entrypoint
-    main(sys.argv)
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+        stream=sys.stdout,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+    script_args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    if "--server-mode" in script_args:
+        serve()
+    else:
+        main(sys.argv)
@@ -6,7 +6,9 @@ canonical skeleton. This is critical for preserving character proportions
 during rig replacement.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 try:
     import bpy
@@ -20,8 +22,24 @@ except ImportError:
 from rigging_bridge.bridge.types import (
     JointPosition,
     JointMapping,
+    PositionTable,
     RigType,
 )
+from rigging_bridge.bridge.utils import requires_armature, world_coords
+
+
+def _build_reverse_index(mapping: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, int]]:
+    """
+    Invert a {canonical_bone: (source_patterns, ...)} mapping.
+
+    The priority is the pattern's position in its list, so the earliest
+    listed alias still wins when a rig contains several of them.
+    """
+    reverse: Dict[str, Tuple[str, int]] = {}
+    for canonical_bone, patterns in mapping.items():
+        for priority, pattern in enumerate(patterns):
+            reverse.setdefault(pattern, (canonical_bone, priority))
+    return reverse
 
 
 class JointMatcher:
@@ -36,79 +54,99 @@ class JointMatcher:
     """
 
     # Mapping from source rig bones to canonical UE5 Mannequin bones
-    # Format: {canonical_bone: [source_bone_patterns]}
-    BONE_MAPPINGS: Dict[RigType, Dict[str, List[str]]] = {
+    # Format: {canonical_bone: (source_bone_patterns, ...)}
+    BONE_MAPPINGS: Dict[RigType, Dict[str, Tuple[str, ...]]] = {
         RigType.ARP: {
-            "pelvis": ["root.x"],
-            "spine_01": ["spine_01.x"],
-            "spine_02": ["spine_02.x"],
-            "spine_03": ["spine_03.x"],
-            "clavicle_l": ["shoulder.l"],
-            "clavicle_r": ["shoulder.r"],
-            "upperarm_l": ["arm_stretch.l"],
-            "upperarm_r": ["arm_stretch.r"],
-            "lowerarm_l": ["forearm_stretch.l"],
-            "lowerarm_r": ["forearm_stretch.r"],
-            "hand_l": ["hand.l"],
-            "hand_r": ["hand.r"],
-            "thigh_l": ["thigh_stretch.l"],
-            "thigh_r": ["thigh_stretch.r"],
-            "calf_l": ["leg_stretch.l"],
-            "calf_r": ["leg_stretch.r"],
-            "foot_l": ["foot.l"],
-            "foot_r": ["foot.r"],
-            "neck_01": ["neck.x"],
-            "head": ["head.x"],
+            "pelvis": ("root.x",),
+            "spine_01": ("spine_01.x",),
+            "spine_02": ("spine_02.x",),
+            "spine_03": ("spine_03.x",),
+            "clavicle_l": ("shoulder.l",),
+            "clavicle_r": ("shoulder.r",),
+            "upperarm_l": ("arm_stretch.l",),
+            "upperarm_r": ("arm_stretch.r",),
+            "lowerarm_l": ("forearm_stretch.l",),
+            "lowerarm_r": ("forearm_stretch.r",),
+            "hand_l": ("hand.l",),
+            "hand_r": ("hand.r",),
+            "thigh_l": ("thigh_stretch.l",),
+            "thigh_r": ("thigh_stretch.r",),
+            "calf_l": ("leg_stretch.l",),
+            "calf_r": ("leg_stretch.r",),
+            "foot_l": ("foot.l",),
+            "foot_r": ("foot.r",),
+            "neck_01": ("neck.x",),
+            "head": ("head.x",),
         },
         RigType.CC3: {
-            "pelvis": ["CC_Base_Hip", "CC_Base_Hips"],
-            "spine_01": ["CC_Base_Spine01"],
-            "spine_02": ["CC_Base_Spine02"],
-            "upperarm_l": ["CC_Base_L_Upperarm"],
-            "upperarm_r": ["CC_Base_R_Upperarm"],
-            "lowerarm_l": ["CC_Base_L_Forearm"],
-            "lowerarm_r": ["CC_Base_R_Forearm"],
-            "hand_l": ["CC_Base_L_Hand"],
-            "hand_r": ["CC_Base_R_Hand"],
-            "thigh_l": ["CC_Base_L_Thigh"],
-            "thigh_r": ["CC_Base_R_Thigh"],
-            "calf_l": ["CC_Base_L_Calf"],
-            "calf_r": ["CC_Base_R_Calf"],
-            "foot_l": ["CC_Base_L_Foot"],
-            "foot_r": ["CC_Base_R_Foot"],
-            "neck_01": ["CC_Base_NeckTwist01"],
-            "head": ["CC_Base_Head"],
+            "pelvis": ("CC_Base_Hip", "CC_Base_Hips"),
+            "spine_01": ("CC_Base_Spine01",),
+            "spine_02": ("CC_Base_Spine02",),
+            "upperarm_l": ("CC_Base_L_Upperarm",),
+            "upperarm_r": ("CC_Base_R_Upperarm",),
+            "lowerarm_l": ("CC_Base_L_Forearm",),
+            "lowerarm_r": ("CC_Base_R_Forearm",),
+            "hand_l": ("CC_Base_L_Hand",),
+            "hand_r": ("CC_Base_R_Hand",),
+            "thigh_l": ("CC_Base_L_Thigh",),
+            "thigh_r": ("CC_Base_R_Thigh",),
+            "calf_l": ("CC_Base_L_Calf",),
+            "calf_r": ("CC_Base_R_Calf",),
+            "foot_l": ("CC_Base_L_Foot",),
+            "foot_r": ("CC_Base_R_Foot",),
+            "neck_01": ("CC_Base_NeckTwist01",),
+            "head": ("CC_Base_Head",),
         },
         RigType.CC4: {
             # CC4 uses similar naming to CC3
-            "pelvis": ["CC_Base_Hips"],
-            "spine_01": ["CC_Base_Spine01"],
-            "upperarm_l": ["CC_Base_L_Upperarm"],
-            "upperarm_r": ["CC_Base_R_Upperarm"],
+            "pelvis": ("CC_Base_Hips",),
+            "spine_01": ("CC_Base_Spine01",),
+            "upperarm_l": ("CC_Base_L_Upperarm",),
+            "upperarm_r": ("CC_Base_R_Upperarm",),
             # ... (full mapping would continue)
         },
         RigType.MIXAMO: {
-            "pelvis": ["Hips"],
-            "spine_01": ["Spine"],
-            "spine_02": ["Spine1"],
-            "spine_03": ["Spine2"],
-            "upperarm_l": ["LeftArm"],
-            "upperarm_r": ["RightArm"],
-            "lowerarm_l": ["LeftForeArm"],
-            "lowerarm_r": ["RightForeArm"],
-            "hand_l": ["LeftHand"],
-            "hand_r": ["RightHand"],
-            "thigh_l": ["LeftUpLeg"],
-            "thigh_r": ["RightUpLeg"],
-            "calf_l": ["LeftLeg"],
-            "calf_r": ["RightLeg"],
-            "foot_l": ["LeftFoot"],
-            "foot_r": ["RightFoot"],
-            "neck_01": ["Neck"],
-            "head": ["Head"],
+            "pelvis": ("Hips",),
+            "spine_01": ("Spine",),
+            "spine_02": ("Spine1",),
+            "spine_03": ("Spine2",),
+            "upperarm_l": ("LeftArm",),
+            "upperarm_r": ("RightArm",),
+            "lowerarm_l": ("LeftForeArm",),
+            "lowerarm_r": ("RightForeArm",),
+            "hand_l": ("LeftHand",),
+            "hand_r": ("RightHand",),
+            "thigh_l": ("LeftUpLeg",),
+            "thigh_r": ("RightUpLeg",),
+            "calf_l": ("LeftLeg",),
+            "calf_r": ("RightLeg",),
+            "foot_l": ("LeftFoot",),
+            "foot_r": ("RightFoot",),
+            "neck_01": ("Neck",),
+            "head": ("Head",),
         },
     }
 
+    # Metrics measured as the distance between two joints: (metric, joint_a, joint_b)
+    _METRIC_PAIRS: Tuple[Tuple[str, str, str], ...] = (
+        ("shoulder_width", "clavicle_l", "clavicle_r"),
+        ("hip_width", "thigh_l", "thigh_r"),
+        ("height", "pelvis", "head"),
+    )
+
+    # Metrics measured along a joint chain: (metric, optional_root, required_chain).
+    # The optional root is prepended to the chain only when present.
+    _METRIC_CHAINS: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+        ("arm_length_l", (), ("clavicle_l", "upperarm_l", "lowerarm_l", "hand_l")),
+        ("leg_length_l", ("pelvis",), ("thigh_l", "calf_l", "foot_l")),
+    )
+
+    # Reverse index {source_pattern: (canonical_bone, priority)}, built once at class load
+    _REVERSE: Dict[RigType, Dict[str, Tuple[str, int]]] = {
+        rig_type: _build_reverse_index(mapping)
+        for rig_type, mapping in BONE_MAPPINGS.items()
+    }
+
     def __init__(self):
         """Initialize the joint matcher."""
         pass
@@ -116,53 +154,77 @@ class JointMatcher:
     def capture_positions(
         self,
         armature: "bpy.types.Object",
-        rig_type: RigType,
+        rig_type: Optional[RigType] = None,
+        include_hierarchy: bool = False,
     ) -> Dict[str, JointPosition]:
         """
         Capture world-space positions of all joints in the armature.
 
+        Per-joint expansion of capture_table for callers that want JointPosition
+        objects; the pipeline works on the table directly.
+
         Args:
             armature: Source armature object
-            rig_type: Detected rig type
+            rig_type: Detected rig type, if known. Not needed for capture, so
+                this can run before or alongside detection.
+            include_hierarchy: Also record parent/children names. Off by default
+                since create_mapping discards the source hierarchy.
 
         Returns:
             Dictionary mapping bone names to JointPosition objects
         """
-        if not BLENDER_AVAILABLE or bpy is None:
-            raise RuntimeError("Blender API is not available")
+        table = self.capture_table(armature, include_hierarchy=include_hierarchy)
+        return table.to_joint_positions(include_hierarchy=include_hierarchy)
 
-        if armature.type != "ARMATURE":
-            raise ValueError(f"Object {armature.name} is not an armature")
+    @requires_armature
+    def capture_table(
+        self,
+        armature: "bpy.types.Object",
+        include_hierarchy: bool = False,
+    ) -> PositionTable:
+        """
+        Capture world-space joint positions as a columnar PositionTable.
 
-        positions: Dict[str, JointPosition] = {}
+        Args:
+            armature: Source armature object
+            include_hierarchy: Resolve each bone's parent row; otherwise all -1
 
-        for bone in armature.data.bones:
-            # Get world space position
-            world_pos = armature.matrix_world @ bone.head_local
+        Returns:
+            PositionTable with one row per bone, in armature bone order
+        """
+        bones = armature.data.bones
+        bone_count = len(bones)
+        names = [bone.name for bone in bones]
 
-            # Build hierarchy info
-            parent_name = bone.parent.name if bone.parent else None
-            child_names = [child.name for child in bone.children]
+        # All rest-pose heads in one bulk copy and a single matmul
+        world = world_coords(bones, "head_local", armature.matrix_world)
 
-            positions[bone.name] = JointPosition(
-                name=bone.name,
-                position=world_pos.copy(),
-                parent=parent_name,
-                children=child_names,
+        table = PositionTable(
+            names=names,
+            positions=world,
+            parent_idx=np.full(bone_count, -1, dtype=np.int32),
+        )
+        if include_hierarchy:
+            index = table.index
+            table.parent_idx = np.fromiter(
+                (index[bone.parent.name] if bone.parent else -1 for bone in bones),
+                dtype=np.int32,
+                count=bone_count,
             )
 
-        return positions
+        return table
 
     def create_mapping(
         self,
-        source_positions: Dict[str, JointPosition],
+        source_positions: Union[PositionTable, Dict[str, JointPosition]],
         rig_type: RigType,
     ) -> JointMapping:
         """
         Create mapping from source rig to canonical UE5 Mannequin skeleton.
 
         Args:
-            source_positions: Joint positions from source rig
+            source_positions: Joint positions from source rig, as captured by
+                capture_table or in per-joint form
             rig_type: Type of source rig
 
         Returns:
@@ -171,38 +233,39 @@ class JointMatcher:
         if rig_type not in self.BONE_MAPPINGS:
             raise ValueError(f"No bone mapping defined for rig type: {rig_type}")
 
-        mapping = self.BONE_MAPPINGS[rig_type]
-        target_positions: Dict[str, JointPosition] = {}
+        if isinstance(source_positions, PositionTable):
+            # JointMapping keeps per-joint source positions for name-based weight
+            # transfer and the metadata JSON, so expand only at this boundary
+            source_positions = source_positions.to_joint_positions()
+
+        reverse = self._REVERSE[rig_type]
+
+        # Single pass over the source bones, keeping the highest-priority alias
+        matches: Dict[str, Tuple[int, JointPosition]] = {}
         unmapped_source: List[str] = []
+        for source_name, source_pos in source_positions.items():
+            hit = reverse.get(source_name)
+            if hit is None:
+                unmapped_source.append(source_name)
+                continue
+            canonical_bone, priority = hit
+            current = matches.get(canonical_bone)
+            if current is None or priority < current[0]:
+                matches[canonical_bone] = (priority, source_pos)
+
+        # Emit targets in canonical order; copy position but use canonical name
+        target_positions: Dict[str, JointPosition] = {}
         unmapped_target: List[str] = []
-
-        # Map canonical bones to source positions
-        for canonical_bone, source_patterns in mapping.items():
-            matched = False
-            for pattern in source_patterns:
-                if pattern in source_positions:
-                    # Copy position but use canonical name
-                    source_pos = source_positions[pattern]
-                    target_positions[canonical_bone] = JointPosition(
-                        name=canonical_bone,
-                        position=source_pos.position,
-                        parent=None,  # Will be set based on canonical hierarchy
-                        children=[],
-                    )
-                    matched = True
-                    break
-
-            if not matched:
+        for canonical_bone in self.BONE_MAPPINGS[rig_type]:
+            match = matches.get(canonical_bone)
+            if match is None:
                 unmapped_target.append(canonical_bone)
-
-        # Find source bones not mapped to canonical
-        mapped_source_bones = set()
-        for patterns in mapping.values():
-            mapped_source_bones.update(patterns)
-
-        for source_bone in source_positions.keys():
-            if source_bone not in mapped_source_bones:
-                unmapped_source.append(source_bone)
+                continue
+            target_positions[canonical_bone] = JointPosition(
+                name=canonical_bone,
+                position=match[1].position,
+                parent=None,  # Will be set based on canonical hierarchy
+            )
 
         return JointMapping(
             source_positions=source_positions,
@@ -213,7 +276,7 @@ class JointMatcher:
 
     def calculate_metrics(
         self,
-        positions: Dict[str, JointPosition],
+        positions: Union[PositionTable, Dict[str, JointPosition]],
     ) -> Dict[str, float]:
         """
         Calculate anatomical metrics from joint positions.
@@ -228,70 +291,44 @@ class JointMatcher:
         - leg_length: Total leg length (hip to foot)
 
         Args:
-            positions: Joint positions
+            positions: Joint positions, as captured by capture_table or in
+                per-joint form
 
         Returns:
             Dictionary of metric names to values
         """
-        metrics: Dict[str, float] = {}
-
-        # Helper to calculate distance
-        def distance(pos1: Vector, pos2: Vector) -> float:
-            return (pos1 - pos2).length
-
-        # Shoulder width
-        if "clavicle_l" in positions and "clavicle_r" in positions:
-            metrics["shoulder_width"] = distance(
-                positions["clavicle_l"].position,
-                positions["clavicle_r"].position,
-            )
-
-        # Hip width
-        if "thigh_l" in positions and "thigh_r" in positions:
-            metrics["hip_width"] = distance(
-                positions["thigh_l"].position,
-                positions["thigh_r"].position,
-            )
-
-        # Height (pelvis to head)
-        if "pelvis" in positions and "head" in positions:
-            metrics["height"] = distance(
-                positions["pelvis"].position,
-                positions["head"].position,
-            )
-
-        # Left arm length
-        if all(k in positions for k in ["clavicle_l", "upperarm_l", "lowerarm_l", "hand_l"]):
-            arm_length = 0.0
-            arm_length += distance(
-                positions["clavicle_l"].position,
-                positions["upperarm_l"].position,
-            )
-            arm_length += distance(
-                positions["upperarm_l"].position,
-                positions["lowerarm_l"].position,
-            )
-            arm_length += distance(
-                positions["lowerarm_l"].position,
-                positions["hand_l"].position,
-            )
-            metrics["arm_length_l"] = arm_length
-
-        # Left leg length
-        if all(k in positions for k in ["thigh_l", "calf_l", "foot_l"]):
-            leg_length = 0.0
-            leg_length += distance(
-                positions["pelvis"].position if "pelvis" in positions else positions["thigh_l"].position,
-                positions["thigh_l"].position,
-            )
-            leg_length += distance(
-                positions["thigh_l"].position,
-                positions["calf_l"].position,
-            )
-            leg_length += distance(
-                positions["calf_l"].position,
-                positions["foot_l"].position,
-            )
-            metrics["leg_length_l"] = leg_length
-
-        return metrics
+        if not isinstance(positions, PositionTable):
+            positions = PositionTable.from_joint_positions(positions)
+        index = positions.index
+
+        # Gather the rows of every segment needed by every metric, then measure
+        # them all at once straight from the position array
+        metric_names: List[str] = []
+        segment_starts: List[int] = []
+        rows_from: List[int] = []
+        rows_to: List[int] = []
+
+        for metric, first, second in self._METRIC_PAIRS:
+            if first in index and second in index:
+                metric_names.append(metric)
+                segment_starts.append(len(rows_from))
+                rows_from.append(index[first])
+                rows_to.append(index[second])
+
+        for metric, optional_root, chain in self._METRIC_CHAINS:
+            if all(joint in index for joint in chain):
+                joints = [joint for joint in optional_root if joint in index]
+                joints.extend(chain)
+                metric_names.append(metric)
+                segment_starts.append(len(rows_from))
+                rows_from.extend(index[joint] for joint in joints[:-1])
+                rows_to.extend(index[joint] for joint in joints[1:])
+
+        if not metric_names:
+            return {}
+
+        coords = positions.positions
+        lengths = np.linalg.norm(coords[rows_from] - coords[rows_to], axis=1)
+        totals = np.add.reduceat(lengths, segment_starts)
+
+        return dict(zip(metric_names, totals.tolist()))
@@ -14,6 +14,7 @@ Workflow:
 7. Export with metadata
 """
 
+import logging
 from pathlib import Path
 from typing import Optional
 
@@ -24,17 +25,19 @@ except ImportError:
     BLENDER_AVAILABLE = False
     bpy = None  # type: ignore
 
-from rigging_bridge.bridge.rig_detector import RigDetector
-from rigging_bridge.bridge.joint_matcher import JointMatcher
-from rigging_bridge.bridge.skeleton_adjuster import CanonicalSkeletonAdjuster
-from rigging_bridge.bridge.weight_transfer import WeightTransfer
-from rigging_bridge.bridge.pose_reset import PoseReset
+try:
+    import orjson
+except ImportError:  # Optional speed-up; falls back to the stdlib encoder
+    orjson = None  # type: ignore
+
 from rigging_bridge.bridge.types import (
     ConversionOptions,
     ConversionResult,
     RigType,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class RigInteropBridge:
     """
@@ -53,6 +56,14 @@ class RigInteropBridge:
         """
         self.options = options or ConversionOptions()
 
+        # Pipeline modules (and NumPy behind them) are imported here rather than
+        # at module load, so importing the bridge package for its types stays cheap.
+        from rigging_bridge.bridge.joint_matcher import JointMatcher
+        from rigging_bridge.bridge.pose_reset import PoseReset
+        from rigging_bridge.bridge.rig_detector import RigDetector
+        from rigging_bridge.bridge.skeleton_adjuster import CanonicalSkeletonAdjuster
+        from rigging_bridge.bridge.weight_transfer import WeightTransfer
+
         # Initialize all modules
         self.detector = RigDetector()
         self.matcher = JointMatcher()
@@ -91,58 +102,61 @@ class RigInteropBridge:
 
         try:
             # Step 1: Detect rig type
-            print("Step 1: Detecting rig type...")
+            logger.debug("Step 1: Detecting rig type...")
             rig_metadata = self.detector.detect(source_armature)
             result.rig_metadata = rig_metadata
 
+            # Step 2: Capture joint positions as one columnar table
+            logger.debug("Step 2: Capturing joint positions...")
+            source_table = self.matcher.capture_table(source_armature)
+
             if rig_metadata.rig_type == RigType.UNKNOWN:
                 result.warnings.append(
                     f"Unknown rig type detected (confidence: {rig_metadata.confidence})"
                 )
 
-            print(f"  Detected: {rig_metadata.rig_type.value} "
-                  f"(confidence: {rig_metadata.confidence:.2f})")
-
-            # Step 2: Capture joint positions from source
-            print("Step 2: Capturing joint positions...")
-            source_positions = self.matcher.capture_positions(
-                source_armature,
-                rig_metadata.rig_type,
+            logger.debug(
+                "  Detected: %s (confidence: %.2f)",
+                rig_metadata.rig_type.value,
+                rig_metadata.confidence,
             )
-            print(f"  Captured {len(source_positions)} joint positions")
+            logger.debug("  Captured %d joint positions", len(source_table))
 
-            # Calculate metrics for validation
-            metrics = self.matcher.calculate_metrics(source_positions)
-            print(f"  Metrics: {metrics}")
+            # Calculate metrics for validation (only when someone will look at them)
+            if self.options.validate_metrics or logger.isEnabledFor(logging.DEBUG):
+                metrics = self.matcher.calculate_metrics(source_table)
+                logger.debug("  Metrics: %s", metrics)
+                if self.options.validate_metrics:
+                    rig_metadata.extra_metadata["metrics"] = metrics
 
             # Step 3: Create mapping to canonical skeleton
-            print("Step 3: Creating joint mapping...")
+            logger.debug("Step 3: Creating joint mapping...")
             joint_mapping = self.matcher.create_mapping(
-                source_positions,
+                source_table,
                 rig_metadata.rig_type,
             )
             result.joint_mapping = joint_mapping
 
-            print(f"  Mapped {len(joint_mapping.target_positions)} joints")
+            logger.debug("  Mapped %d joints", len(joint_mapping.target_positions))
             if joint_mapping.unmapped_source:
-                print(f"  Unmapped source bones: {len(joint_mapping.unmapped_source)}")
+                logger.debug("  Unmapped source bones: %d", len(joint_mapping.unmapped_source))
                 result.warnings.append(
                     f"{len(joint_mapping.unmapped_source)} source bones not mapped"
                 )
             if joint_mapping.unmapped_target:
-                print(f"  Unmapped target bones: {len(joint_mapping.unmapped_target)}")
+                logger.debug("  Unmapped target bones: %d", len(joint_mapping.unmapped_target))
                 result.warnings.append(
                     f"{len(joint_mapping.unmapped_target)} target bones not found in source"
                 )
 
             # Step 4: Adjust canonical skeleton to match source proportions
             if self.options.preserve_proportions:
-                print("Step 4: Adjusting canonical skeleton to match source...")
+                logger.debug("Step 4: Adjusting canonical skeleton to match source...")
                 original_positions = self.adjuster.adjust_to_match(
                     canonical_armature,
                     joint_mapping,
                 )
-                print(f"  Adjusted {len(original_positions)} bones")
+                logger.debug("  Adjusted %d bones", len(original_positions))
 
                 # Validate adjustment
                 is_valid, errors = self.adjuster.validate_adjustment(
@@ -152,18 +166,18 @@ class RigInteropBridge:
                 if not is_valid:
                     result.warnings.extend(errors)
             else:
-                print("Step 4: Skipping proportion preservation")
+                logger.debug("Step 4: Skipping proportion preservation")
                 original_positions = None
 
             # Step 5: Transfer skin weights
-            print("Step 5: Transferring skin weights...")
+            logger.debug("Step 5: Transferring skin weights...")
             transfer_stats = self.weight_transfer.transfer_weights(
                 source_mesh,
                 canonical_armature,
                 joint_mapping,
                 method="hybrid",
             )
-            print(f"  {transfer_stats}")
+            logger.debug("  %s", transfer_stats)
 
             # Swap armature
             self.weight_transfer.swap_armature(source_mesh, canonical_armature)
@@ -178,7 +192,7 @@ class RigInteropBridge:
                     result.warnings.extend(warnings)
 
             # Step 6: Reset to canonical rest pose
-            print("Step 6: Resetting to canonical rest pose...")
+            logger.debug("Step 6: Resetting to canonical rest pose...")
             self.pose_reset.reset_to_rest_pose(
                 canonical_armature,
                 original_positions=original_positions,
@@ -195,22 +209,25 @@ class RigInteropBridge:
 
             # Step 7: Export (if path provided)
             if output_path:
-                print(f"Step 7: Exporting to {output_path}...")
+                logger.debug("Step 7: Exporting to %s...", output_path)
                 self._export(source_mesh, canonical_armature, output_path)
                 result.output_path = str(output_path)
             else:
-                print("Step 7: Skipping export (no output path provided)")
+                logger.debug("Step 7: Skipping export (no output path provided)")
 
             # Success!
             result.success = True
-            print("Conversion complete!")
+            logger.info(
+                "Conversion complete: %s rig, %d joints mapped, %d warning(s)",
+                rig_metadata.rig_type.value,
+                len(joint_mapping.target_positions),
+                len(result.warnings),
+            )
 
         except Exception as e:
             result.success = False
             result.errors.append(f"Conversion failed: {str(e)}")
-            print(f"ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Conversion failed")
 
         return result
 
@@ -267,14 +284,18 @@ class RigInteropBridge:
             result: ConversionResult to serialize
             output_path: Path to write JSON file
         """
-        import json
-
         metadata = result.to_dict()
 
-        with open(output_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            import json
 
-        print(f"Metadata exported to {output_path}")
+            with open(output_path, "w") as f:
+                json.dump(metadata, f, indent=2)
+
+        logger.debug("Metadata exported to %s", output_path)
 
     def validate_conversion(
         self,
@@ -310,14 +331,12 @@ class RigInteropBridge:
 
         # Check for excessive unmapped bones
         if result.joint_mapping:
-            unmapped_pct = (
-                len(result.joint_mapping.unmapped_target) /
-                len(result.joint_mapping.target_positions)
-                if result.joint_mapping.target_positions else 0
-            )
-            if unmapped_pct > 0.3:  # More than 30% unmapped
+            n_target = len(result.joint_mapping.target_positions)
+            n_unmapped = len(result.joint_mapping.unmapped_target)
+            # More than 30% unmapped, compared in integers to skip the division
+            if n_target and n_unmapped * 10 > n_target * 3:
                 critical_errors.append(
-                    f"Too many unmapped target bones: {unmapped_pct:.1%}"
+                    f"Too many unmapped target bones: {n_unmapped / n_target:.1%}"
                 )
                 is_valid = False
 
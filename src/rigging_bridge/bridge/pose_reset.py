@@ -8,8 +8,11 @@ This is the final step that ensures all output characters share the
 same canonical rest pose, enabling animation retargeting.
 """
 
+import math
 from typing import Dict, Optional
 
+import numpy as np
+
 try:
     import bpy
     from mathutils import Vector, Matrix
@@ -20,7 +23,48 @@ except ImportError:
     Vector = tuple  # type: ignore
     Matrix = None  # type: ignore
 
-from rigging_bridge.bridge.types import RestPose
+from rigging_bridge.bridge.types import PositionTuple, RestPose
+from rigging_bridge.bridge.utils import armature_mode, requires_armature
+
+# Rest-pose arm rotations about Z as (w, x, y, z) quaternions: w = cos(θ/2), z = sin(θ/2)
+Q_POS_90Z = (math.cos(math.pi / 4), 0.0, 0.0, math.sin(math.pi / 4))
+Q_NEG_90Z = (math.cos(math.pi / 4), 0.0, 0.0, -math.sin(math.pi / 4))
+Q_POS_45Z = (math.cos(math.pi / 8), 0.0, 0.0, math.sin(math.pi / 8))
+Q_NEG_45Z = (math.cos(math.pi / 8), 0.0, 0.0, -math.sin(math.pi / 8))
+
+
+def _clear_pose_transforms(pose_bones, all_rotation_modes: bool = False) -> None:
+    """
+    Reset location, rotation and scale on every pose bone.
+
+    Uses one bulk foreach_set per property instead of three or more RNA writes
+    per bone. With ``all_rotation_modes`` the Euler and axis-angle rotations
+    are reset as well, so every bone ends up unrotated whatever its mode.
+    """
+    count = len(pose_bones)
+    zeros = np.zeros(count * 3, dtype=np.float32)
+    pose_bones.foreach_set("location", zeros)
+    pose_bones.foreach_set(
+        "rotation_quaternion",
+        np.tile(np.array((1.0, 0.0, 0.0, 0.0), dtype=np.float32), count),
+    )
+    if all_rotation_modes:
+        pose_bones.foreach_set("rotation_euler", zeros)
+        pose_bones.foreach_set(
+            "rotation_axis_angle",
+            np.tile(np.array((0.0, 0.0, 1.0, 0.0), dtype=np.float32), count),
+        )
+    pose_bones.foreach_set("scale", np.ones(count * 3, dtype=np.float32))
+
+
+def _z_rotation(pose_bone) -> float:
+    """
+    Z rotation of a pose bone in radians, whatever its rotation mode.
+
+    matrix_basis already folds in quaternion, axis-angle or Euler rotation,
+    so bones posed with quaternions are measured correctly too.
+    """
+    return pose_bone.matrix_basis.to_euler("XYZ").z
 
 
 class PoseReset:
@@ -31,14 +75,24 @@ class PoseReset:
     ensuring all output characters can share animations.
     """
 
+    # Expected upper-arm Z rotation (radians) per rest pose
+    _REST_POSE_EXPECTATIONS: Dict[RestPose, Dict[str, float]] = {
+        # Arms horizontal: ~90° / ~-90°
+        RestPose.T_POSE: {"upperarm_l": 1.5708, "upperarm_r": -1.5708},
+        # Arms at ~45°
+        RestPose.A_POSE: {"upperarm_l": 0.7854, "upperarm_r": -0.7854},
+    }
+
     def __init__(self):
         """Initialize the pose reset system."""
-        pass
+        # Set once pose bones carry transforms that still need baking
+        self._pose_dirty = False
 
+    @requires_armature
     def reset_to_rest_pose(
         self,
         armature: "bpy.types.Object",
-        original_positions: Optional[Dict[str, Vector]] = None,
+        original_positions: Optional[Dict[str, PositionTuple]] = None,
         target_pose: RestPose = RestPose.T_POSE,
     ) -> None:
         """
@@ -49,150 +103,139 @@ class PoseReset:
 
         Args:
             armature: Armature to reset
-            original_positions: Optional dict of bone name -> original position
+            original_positions: Optional dict of bone name -> original (x, y, z) head
             target_pose: Target rest pose type
         """
-        if not BLENDER_AVAILABLE or bpy is None:
-            raise RuntimeError("Blender API is not available")
-
-        if armature.type != "ARMATURE":
-            raise ValueError(f"Object {armature.name} is not an armature")
-
-        bpy.context.view_layer.objects.active = armature
+        if not original_positions and target_pose not in (RestPose.T_POSE, RestPose.A_POSE):
+            raise ValueError(f"Unknown rest pose type: {target_pose}")
 
         if original_positions:
-            # Restore exact original positions
-            self._restore_exact_positions(armature, original_positions)
-        else:
+            # Restore exact original positions. Pose bones are untouched, so
+            # there is nothing to bake and no POSE transition is needed.
+            with armature_mode(armature, "EDIT"):
+                self._restore_exact_positions(armature, original_positions)
+            return
+
+        # One POSE pass covers both posing and baking
+        with armature_mode(armature, "POSE"):
             # Apply standard rest pose
+            pose_bones = armature.pose.bones
             if target_pose == RestPose.T_POSE:
-                self._apply_t_pose(armature)
-            elif target_pose == RestPose.A_POSE:
-                self._apply_a_pose(armature)
+                self._apply_t_pose(pose_bones)
             else:
-                raise ValueError(f"Unknown rest pose type: {target_pose}")
+                self._apply_a_pose(pose_bones)
 
-        # Apply the pose as the new rest pose
-        self._bake_as_rest_pose(armature)
+            # Apply the pose as the new rest pose
+            self._bake_as_rest_pose(armature)
 
     def _restore_exact_positions(
         self,
         armature: "bpy.types.Object",
-        original_positions: Dict[str, Vector],
+        original_positions: Dict[str, PositionTuple],
     ) -> None:
         """
         Restore bones to their exact original positions.
 
         This undoes the adjustment made by CanonicalSkeletonAdjuster.
+        Expects the armature to already be in EDIT mode.
         """
-        bpy.ops.object.mode_set(mode="EDIT")
-
-        edit_bones = armature.data.edit_bones
+        # One pass over the collection instead of two string lookups per bone
+        ebones_by_name = {bone.name: bone for bone in armature.data.edit_bones}
 
         for bone_name, original_pos in original_positions.items():
-            if bone_name in edit_bones:
-                bone = edit_bones[bone_name]
+            bone = ebones_by_name.get(bone_name)
+            if bone is None:
+                continue
 
-                # Calculate the offset needed
-                current_head = bone.head.copy()
-                offset = original_pos - current_head
+            # Calculate the offset needed
+            original_pos = Vector(original_pos)
+            offset = original_pos - bone.head
 
-                # Move bone back to original position
-                bone.head = original_pos
-                bone.tail = bone.tail + offset
+            # Move bone back to original position
+            bone.head = original_pos
+            bone.tail = bone.tail + offset
 
-        bpy.ops.object.mode_set(mode="OBJECT")
+        self._pose_dirty = False
 
-    def _apply_t_pose(self, armature: "bpy.types.Object") -> None:
+    def _apply_t_pose(self, pose_bones) -> None:
         """
-        Apply T-pose to armature.
+        Apply T-pose to the armature's pose bones.
+
+        Expects the armature to already be in POSE mode.
 
         T-pose characteristics:
         - Arms extend straight out to sides (90° from body)
         - Legs straight down
         - Spine vertical
         """
-        bpy.ops.object.mode_set(mode="POSE")
-
-        pose_bones = armature.pose.bones
-
-        # Reset all bone rotations first
-        for bone in pose_bones:
-            bone.rotation_mode = "QUATERNION"
-            bone.rotation_quaternion = (1, 0, 0, 0)
-            bone.location = (0, 0, 0)
-            bone.scale = (1, 1, 1)
+        # Reset all bone rotations in bulk, whatever each bone's rotation mode;
+        # only the bones rotated below are switched to quaternion mode
+        _clear_pose_transforms(pose_bones, all_rotation_modes=True)
+        self._pose_dirty = True
 
         # Rotate arms to T-pose (90° outward)
         arm_bones = ["clavicle_l", "upperarm_l", "lowerarm_l"]
         for bone_name in arm_bones:
-            if bone_name in pose_bones:
-                bone = pose_bones[bone_name]
-                bone.rotation_mode = "XYZ"
+            bone = pose_bones.get(bone_name)
+            if bone is not None:
                 # Rotate around Z-axis for left arm
-                bone.rotation_euler.z = 1.5708  # 90 degrees in radians
+                bone.rotation_mode = "QUATERNION"
+                bone.rotation_quaternion = Q_POS_90Z
 
         arm_bones_r = ["clavicle_r", "upperarm_r", "lowerarm_r"]
         for bone_name in arm_bones_r:
-            if bone_name in pose_bones:
-                bone = pose_bones[bone_name]
-                bone.rotation_mode = "XYZ"
+            bone = pose_bones.get(bone_name)
+            if bone is not None:
                 # Rotate around Z-axis for right arm
-                bone.rotation_euler.z = -1.5708  # -90 degrees
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+                bone.rotation_mode = "QUATERNION"
+                bone.rotation_quaternion = Q_NEG_90Z
 
-    def _apply_a_pose(self, armature: "bpy.types.Object") -> None:
+    def _apply_a_pose(self, pose_bones) -> None:
         """
-        Apply A-pose to armature.
+        Apply A-pose to the armature's pose bones.
+
+        Expects the armature to already be in POSE mode.
 
         A-pose characteristics:
         - Arms angled down at ~45° from body
         - Legs straight down (may be slightly apart)
         - Spine vertical
         """
-        bpy.ops.object.mode_set(mode="POSE")
-
-        pose_bones = armature.pose.bones
-
-        # Reset all bone rotations
-        for bone in pose_bones:
-            bone.rotation_mode = "QUATERNION"
-            bone.rotation_quaternion = (1, 0, 0, 0)
-            bone.location = (0, 0, 0)
-            bone.scale = (1, 1, 1)
+        # Reset all bone rotations in bulk, whatever each bone's rotation mode;
+        # only the bones rotated below are switched to quaternion mode
+        _clear_pose_transforms(pose_bones, all_rotation_modes=True)
+        self._pose_dirty = True
 
         # Rotate arms to A-pose (~45° downward)
         arm_bones_l = ["clavicle_l", "upperarm_l"]
         for bone_name in arm_bones_l:
-            if bone_name in pose_bones:
-                bone = pose_bones[bone_name]
-                bone.rotation_mode = "XYZ"
-                bone.rotation_euler.z = 0.7854  # 45 degrees
+            bone = pose_bones.get(bone_name)
+            if bone is not None:
+                bone.rotation_mode = "QUATERNION"
+                bone.rotation_quaternion = Q_POS_45Z
 
         arm_bones_r = ["clavicle_r", "upperarm_r"]
         for bone_name in arm_bones_r:
-            if bone_name in pose_bones:
-                bone = pose_bones[bone_name]
-                bone.rotation_mode = "XYZ"
-                bone.rotation_euler.z = -0.7854  # -45 degrees
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+            bone = pose_bones.get(bone_name)
+            if bone is not None:
+                bone.rotation_mode = "QUATERNION"
+                bone.rotation_quaternion = Q_NEG_45Z
 
     def _bake_as_rest_pose(self, armature: "bpy.types.Object") -> None:
         """
         Bake the current pose as the new rest pose.
 
         This applies the pose transforms to the armature permanently.
+        Expects the armature to already be in POSE mode. Does nothing when
+        no pose has been applied since the last bake or restore.
         """
-        bpy.context.view_layer.objects.active = armature
-        bpy.ops.object.mode_set(mode="POSE")
+        if not self._pose_dirty:
+            return
 
-        # Apply pose as rest pose
         bpy.ops.pose.armature_apply(selected=False)
+        self._pose_dirty = False
 
-        bpy.ops.object.mode_set(mode="OBJECT")
-
+    @requires_armature
     def clear_all_transforms(self, armature: "bpy.types.Object") -> None:
         """
         Clear all transforms on armature bones.
@@ -202,19 +245,8 @@ class PoseReset:
         Args:
             armature: Armature to clear
         """
-        if not BLENDER_AVAILABLE or bpy is None:
-            raise RuntimeError("Blender API is not available")
-
-        bpy.context.view_layer.objects.active = armature
-        bpy.ops.object.mode_set(mode="POSE")
-
-        for bone in armature.pose.bones:
-            bone.location = (0, 0, 0)
-            bone.rotation_quaternion = (1, 0, 0, 0)
-            bone.rotation_euler = (0, 0, 0)
-            bone.scale = (1, 1, 1)
-
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with armature_mode(armature, "POSE"):
+            _clear_pose_transforms(armature.pose.bones, all_rotation_modes=True)
 
     def validate_rest_pose(
         self,
@@ -236,38 +268,24 @@ class PoseReset:
         warnings: list[str] = []
         is_valid = True
 
+        expectations = self._REST_POSE_EXPECTATIONS.get(target_pose)
+        if not expectations:
+            return is_valid, warnings
+
         # Check key bone orientations
-        if target_pose == RestPose.T_POSE:
-            # Check that arms are horizontal
-            for side in ["l", "r"]:
-                bone_name = f"upperarm_{side}"
-                if bone_name in armature.pose.bones:
-                    bone = armature.pose.bones[bone_name]
-                    # Check Z rotation is ~90° or ~-90°
-                    expected = 1.5708 if side == "l" else -1.5708
-                    actual = bone.rotation_euler.z if bone.rotation_mode == "XYZ" else 0
-
-                    if abs(actual - expected) > tolerance:
-                        warnings.append(
-                            f"Bone {bone_name} not in T-pose: "
-                            f"Z rotation is {actual:.2f}, expected {expected:.2f}"
-                        )
-                        is_valid = False
-
-        elif target_pose == RestPose.A_POSE:
-            # Check that arms are at ~45°
-            for side in ["l", "r"]:
-                bone_name = f"upperarm_{side}"
-                if bone_name in armature.pose.bones:
-                    bone = armature.pose.bones[bone_name]
-                    expected = 0.7854 if side == "l" else -0.7854
-                    actual = bone.rotation_euler.z if bone.rotation_mode == "XYZ" else 0
-
-                    if abs(actual - expected) > tolerance:
-                        warnings.append(
-                            f"Bone {bone_name} not in A-pose: "
-                            f"Z rotation is {actual:.2f}, expected {expected:.2f}"
-                        )
-                        is_valid = False
+        pose_bones = armature.pose.bones
+        pose_label = target_pose.value.replace("_", "-").capitalize()
+        for bone_name, expected in expectations.items():
+            bone = pose_bones.get(bone_name)
+            if bone is None:
+                continue
+
+            actual = _z_rotation(bone)
+            if abs(actual - expected) > tolerance:
+                warnings.append(
+                    f"Bone {bone_name} not in {pose_label}: "
+                    f"Z rotation is {actual:.2f}, expected {expected:.2f}"
+                )
+                is_valid = False
 
         return is_valid, warnings
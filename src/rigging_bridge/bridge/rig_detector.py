@@ -5,7 +5,19 @@ Automatically identifies the type of rig (ARP, CC3/4, Mixamo, VRM, etc.)
 based on bone naming conventions, hierarchy patterns, and bone counts.
 """
 
-from typing import Dict, List, Optional, Set
+import sys
+from typing import (
+    AbstractSet,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 try:
     import bpy
@@ -15,6 +27,46 @@ except ImportError:
     bpy = None  # type: ignore
 
 from rigging_bridge.bridge.types import RigType, RigMetadata, RestPose
+from rigging_bridge.bridge.utils import requires_armature
+
+
+# Conventional rest pose per rig type
+_POSE_DEFAULTS: Final[Dict[RigType, RestPose]] = {
+    RigType.ARP: RestPose.A_POSE,
+    RigType.CC3: RestPose.A_POSE,
+    RigType.CC4: RestPose.A_POSE,
+    RigType.MIXAMO: RestPose.T_POSE,
+    RigType.VRM: RestPose.A_POSE,
+    RigType.METAHUMAN: RestPose.A_POSE,
+    RigType.UE5_MANNEQUIN: RestPose.T_POSE,
+}
+
+
+class _CompiledSignature(NamedTuple):
+    """RIG_SIGNATURES entry pre-processed for set-based scoring."""
+
+    rig_type: RigType
+    required: FrozenSet[str]
+    patterns: FrozenSet[str]
+    min_confidence: float
+    required_count: int
+    pattern_count: int
+
+
+def _index_patterns(
+    signatures: List[_CompiledSignature],
+) -> Dict[str, Tuple[int, ...]]:
+    """
+    Build a reverse index {pattern_bone: (signature_index, ...)}.
+
+    Lets pattern hits for every signature be counted in one walk over the known
+    pattern bones instead of one set intersection per signature.
+    """
+    index: Dict[str, List[int]] = {}
+    for position, signature in enumerate(signatures):
+        for bone in signature.patterns:
+            index.setdefault(bone, []).append(position)
+    return {bone: tuple(positions) for bone, positions in index.items()}
 
 
 class RigDetector:
@@ -64,10 +116,28 @@ class RigDetector:
         },
     }
 
+    # Signatures compiled once at class load: frozensets let scoring use C-level
+    # set intersection instead of re-scanning the bone lists on every call.
+    # Names are interned (literals such as "root.x" are not by default) so that
+    # probes with interned armature bone names can match on identity.
+    _COMPILED_SIGNATURES: List[_CompiledSignature] = [
+        _CompiledSignature(
+            rig_type=rig_type,
+            required=frozenset(map(sys.intern, signature["required_bones"])),
+            patterns=frozenset(map(sys.intern, signature.get("pattern_bones", ()))),
+            min_confidence=signature["min_confidence"],
+            required_count=len(signature["required_bones"]),
+            pattern_count=len(signature.get("pattern_bones", ())),
+        )
+        for rig_type, signature in RIG_SIGNATURES.items()
+    ]
+    _PATTERN_TO_SIGS = _index_patterns(_COMPILED_SIGNATURES)
+
     def __init__(self):
         """Initialize the rig detector."""
         pass
 
+    @requires_armature
     def detect(self, armature: "bpy.types.Object") -> RigMetadata:
         """
         Detect the rig type of the given armature.
@@ -78,32 +148,15 @@ class RigDetector:
         Returns:
             RigMetadata with detected type and confidence score
         """
-        if not BLENDER_AVAILABLE or bpy is None:
-            raise RuntimeError("Blender API is not available")
-
-        if armature.type != "ARMATURE":
-            raise ValueError(f"Object {armature.name} is not an armature")
-
         bone_names = self._get_bone_names(armature)
         bone_count = len(bone_names)
 
         # Try to detect each rig type
-        detections: List[tuple[RigType, float]] = []
-
-        for rig_type, signature in self.RIG_SIGNATURES.items():
-            confidence = self._calculate_confidence(bone_names, signature)
-            if confidence >= signature["min_confidence"]:
-                detections.append((rig_type, confidence))
+        rig_type, confidence = self._best_match(bone_names)
 
-        # Sort by confidence descending
-        detections.sort(key=lambda x: x[1], reverse=True)
-
-        if detections:
-            rig_type, confidence = detections[0]
+        if rig_type != RigType.UNKNOWN:
             rest_pose = self._detect_rest_pose(armature, rig_type)
         else:
-            rig_type = RigType.UNKNOWN
-            confidence = 0.0
             rest_pose = RestPose.CUSTOM
 
         return RigMetadata(
@@ -115,37 +168,56 @@ class RigDetector:
         )
 
     def _get_bone_names(self, armature: "bpy.types.Object") -> Set[str]:
-        """Extract all bone names from the armature."""
-        return {bone.name for bone in armature.data.bones}
-
-    def _calculate_confidence(
-        self,
-        bone_names: Set[str],
-        signature: Dict[str, any],
-    ) -> float:
-        """
-        Calculate confidence score for a rig signature.
+        """Extract all bone names from the armature, interned for identity-fast lookups."""
+        return {sys.intern(bone.name) for bone in armature.data.bones}
 
-        Confidence is based on:
-        - Required bones present (must have all)
-        - Pattern bones present (bonus points)
+    def _best_match(self, bone_names: AbstractSet[str]) -> Tuple[RigType, float]:
         """
-        required = signature["required_bones"]
-        patterns = signature.get("pattern_bones", [])
+        Pick the highest-confidence signature that clears its threshold.
 
-        # Check required bones
-        required_found = sum(1 for bone in required if bone in bone_names)
-        if required_found < len(required):
-            return 0.0  # Missing required bones = no match
+        Single pass, no intermediate list or sort; ties keep the signature
+        declared first in RIG_SIGNATURES.
 
-        # Check pattern bones
-        pattern_found = sum(1 for bone in patterns if bone in bone_names)
-        pattern_score = pattern_found / len(patterns) if patterns else 0.0
+        Returns:
+            (rig_type, confidence), or (RigType.UNKNOWN, 0.0) if nothing matches
+        """
+        best_type, best_confidence = RigType.UNKNOWN, 0.0
+        confidences = self._score_signatures(bone_names)
+        for signature, confidence in zip(self._COMPILED_SIGNATURES, confidences):
+            if confidence >= signature.min_confidence and confidence > best_confidence:
+                best_type, best_confidence = signature.rig_type, confidence
+        return best_type, best_confidence
+
+    def _score_signatures(self, bone_names: AbstractSet[str]) -> List[float]:
+        """
+        Score every signature at once.
 
-        # Base confidence from required bones (0.6) + pattern bonus (0.4)
-        confidence = 0.6 + (0.4 * pattern_score)
+        A signature missing any required bone scores 0.0 right away; issubset
+        stops at the first missing one, and its pattern bones are never looked
+        at. When some signatures survive, their pattern hits are counted in
+        one walk over the pattern reverse index, and each scores 0.6 plus up
+        to 0.4 for the share of its pattern bones present.
 
-        return confidence
+        Returns:
+            Confidence per entry of _COMPILED_SIGNATURES
+        """
+        signatures = self._COMPILED_SIGNATURES
+        matched = [signature.required.issubset(bone_names) for signature in signatures]
+        if not any(matched):
+            return [0.0] * len(signatures)
+
+        pattern_hits = [0] * len(signatures)
+        for bone, positions in self._PATTERN_TO_SIGS.items():
+            if bone in bone_names:
+                for position in positions:
+                    pattern_hits[position] += 1
+
+        return [
+            0.6 + 0.4 * (hits / signature.pattern_count if signature.pattern_count else 0.0)
+            if is_match
+            else 0.0
+            for signature, is_match, hits in zip(signatures, matched, pattern_hits)
+        ]
 
     def _detect_rest_pose(
         self,
@@ -159,52 +231,31 @@ class RigDetector:
         A more robust implementation would analyze actual bone angles.
         """
         # For now, use common conventions per rig type
-        pose_defaults = {
-            RigType.ARP: RestPose.A_POSE,
-            RigType.CC3: RestPose.A_POSE,
-            RigType.CC4: RestPose.A_POSE,
-            RigType.MIXAMO: RestPose.T_POSE,
-            RigType.VRM: RestPose.A_POSE,
-            RigType.METAHUMAN: RestPose.A_POSE,
-            RigType.UE5_MANNEQUIN: RestPose.T_POSE,
-        }
-
-        return pose_defaults.get(rig_type, RestPose.CUSTOM)
-
-    def detect_from_bone_list(self, bone_names: List[str]) -> RigMetadata:
+        return _POSE_DEFAULTS.get(rig_type, RestPose.CUSTOM)
+
+    def detect_from_bone_list(self, bone_names: Iterable[str]) -> RigMetadata:
         """
-        Detect rig type from a list of bone names (without Blender context).
+        Detect rig type from bone names (without Blender context).
 
         Useful for testing and validation.
 
         Args:
-            bone_names: List of bone name strings
+            bone_names: Any iterable of bone name strings (list, set, generator)
 
         Returns:
             RigMetadata with detected type and confidence
         """
-        bone_set = set(bone_names)
-        bone_count = len(bone_names)
-
-        detections: List[tuple[RigType, float]] = []
+        # Materialise the iterable exactly once; the set is built from that list
+        bone_list = list(bone_names)
+        bone_set = frozenset(bone_list)
+        bone_count = len(bone_list)
 
-        for rig_type, signature in self.RIG_SIGNATURES.items():
-            confidence = self._calculate_confidence(bone_set, signature)
-            if confidence >= signature["min_confidence"]:
-                detections.append((rig_type, confidence))
-
-        detections.sort(key=lambda x: x[1], reverse=True)
-
-        if detections:
-            rig_type, confidence = detections[0]
-        else:
-            rig_type = RigType.UNKNOWN
-            confidence = 0.0
+        rig_type, confidence = self._best_match(bone_set)
 
         return RigMetadata(
             rig_type=rig_type,
             rest_pose=RestPose.CUSTOM,
             bone_count=bone_count,
             confidence=confidence,
-            detected_bones=bone_names,
+            detected_bones=bone_list,
         )
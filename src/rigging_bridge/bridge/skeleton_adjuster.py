@@ -13,7 +13,10 @@ The workflow is:
 5. Reset to canonical rest pose (done by RestPoseReset module)
 """
 
-from typing import Dict, Optional
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 try:
     import bpy
@@ -24,7 +27,50 @@ except ImportError:
     bpy = None  # type: ignore
     Vector = tuple  # type: ignore
 
-from rigging_bridge.bridge.types import JointPosition, JointMapping
+from rigging_bridge.bridge.types import JointPosition, JointMapping, PositionTuple
+from rigging_bridge.bridge.utils import armature_mode, requires_armature
+
+
+def _sync_connected(
+    edit_bones,
+    rows: Dict[str, int],
+    selected: List[int],
+    heads: np.ndarray,
+    tails: np.ndarray,
+) -> None:
+    """
+    Keep connected bones joined after moving the ``selected`` rows.
+
+    foreach_set skips the RNA update that per-bone head/tail assignment runs,
+    which snaps a connected parent's tail to the bone's head and connected
+    children's heads to the bone's tail. This applies the same rule to the
+    (N, 3) ``heads``/``tails`` arrays in place, resolving conflicts as the
+    per-bone writes did in parent-before-child order: a moved bone keeps its
+    own head, and a moved child's head wins over its parent's computed tail.
+    """
+    bone_count = len(heads)
+    connected = np.zeros(bone_count, dtype=bool)
+    edit_bones.foreach_get("use_connect", connected)
+    if not connected.any():
+        return
+
+    parents = np.fromiter(
+        (rows[bone.parent.name] if bone.parent else -1 for bone in edit_bones),
+        dtype=np.intp,
+        count=bone_count,
+    )
+    connected &= parents >= 0
+    moved = np.zeros(bone_count, dtype=bool)
+    moved[selected] = True
+
+    # Connected children that were not moved themselves follow their parent's tail
+    followers = np.flatnonzero(connected & ~moved)
+    followers = followers[moved[parents[followers]]]
+    heads[followers] = tails[parents[followers]]
+
+    # Connected parents of moved bones have their tail pulled to the new head
+    pulled = np.flatnonzero(connected & moved)
+    tails[parents[pulled]] = heads[pulled]
 
 
 class CanonicalSkeletonAdjuster:
@@ -35,15 +81,23 @@ class CanonicalSkeletonAdjuster:
     the original character's body shape (wide shoulders, long legs, etc.)
     """
 
+    # (factor, joint chain) - a factor's measurement is the summed length of its chain
+    _SCALE_CHAINS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ("shoulder_width", ("clavicle_l", "clavicle_r")),
+        ("spine_height", ("pelvis", "spine_01")),
+        ("leg_length", ("thigh_l", "calf_l", "foot_l")),
+    )
+
     def __init__(self):
         """Initialize the skeleton adjuster."""
         pass
 
+    @requires_armature
     def adjust_to_match(
         self,
         canonical_armature: "bpy.types.Object",
         joint_mapping: JointMapping,
-    ) -> Dict[str, Vector]:
+    ) -> Dict[str, PositionTuple]:
         """
         Adjust canonical skeleton bones to match source joint positions.
 
@@ -55,54 +109,83 @@ class CanonicalSkeletonAdjuster:
             joint_mapping: Mapping from source to target joint positions
 
         Returns:
-            Dictionary of original bone positions (for reset/undo)
+            Dictionary of original bone head positions as (x, y, z) tuples (for reset/undo)
         """
-        if not BLENDER_AVAILABLE or bpy is None:
-            raise RuntimeError("Blender API is not available")
-
-        if canonical_armature.type != "ARMATURE":
-            raise ValueError(f"Object {canonical_armature.name} is not an armature")
+        # Enter edit mode to modify bone positions (no-op if the caller already did)
+        with armature_mode(canonical_armature, "EDIT"):
+            edit_bones = canonical_armature.data.edit_bones
+            bone_count = len(edit_bones)
 
-        # Store original positions for later reset
-        original_positions: Dict[str, Vector] = {}
+            # Rows in foreach_* buffers follow edit_bones order
+            rows = {bone.name: row for row, bone in enumerate(edit_bones)}
 
-        # Enter edit mode to modify bone positions
-        bpy.context.view_layer.objects.active = canonical_armature
-        bpy.ops.object.mode_set(mode="EDIT")
-
-        edit_bones = canonical_armature.data.edit_bones
-
-        try:
+            names: List[str] = []
+            selected: List[int] = []
+            target_heads: List[PositionTuple] = []
             for canonical_name, target_pos in joint_mapping.target_positions.items():
-                if canonical_name not in edit_bones:
+                row = rows.get(canonical_name)
+                if row is None:
                     continue
-
-                bone = edit_bones[canonical_name]
-
-                # Store original position
-                original_positions[canonical_name] = bone.head.copy()
-
-                # Move bone head to match source position
-                bone.head = target_pos.position.copy()
-
-                # Adjust tail to maintain bone length and orientation
-                # This is simplified - production version would handle orientation better
-                original_length = (bone.tail - original_positions[canonical_name]).length
-                bone_direction = (bone.tail - bone.head).normalized()
-                bone.tail = bone.head + (bone_direction * original_length)
-
-        finally:
-            # Return to object mode
-            bpy.ops.object.mode_set(mode="OBJECT")
-
+                names.append(canonical_name)
+                selected.append(row)
+                target_heads.append(tuple(target_pos.position))
+
+            if not names:
+                return {}
+
+            heads = np.empty(bone_count * 3, dtype=np.float32)
+            tails = np.empty(bone_count * 3, dtype=np.float32)
+            edit_bones.foreach_get("head", heads)
+            edit_bones.foreach_get("tail", tails)
+            heads = heads.reshape(-1, 3)
+            tails = tails.reshape(-1, 3)
+
+            # Store original positions for later reset
+            original_heads = heads[selected]
+            original_tails = tails[selected]
+
+            # Move bone heads to match source positions
+            new_heads = np.array(target_heads, dtype=np.float32)
+
+            # Adjust tails to maintain bone length and orientation
+            # This is simplified - production version would handle orientation better
+            original_lengths = np.linalg.norm(original_tails - original_heads, axis=1)
+            directions = original_tails - new_heads
+            direction_lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+            # Degenerate directions stay zero, as Vector.normalized() leaves them
+            np.divide(directions, direction_lengths, out=directions, where=direction_lengths > 0)
+
+            new_tails = new_heads + directions * original_lengths[:, None]
+
+            if canonical_armature.data.use_mirror_x:
+                # X-mirror editing is applied by the per-bone RNA update, which
+                # bulk writes skip, so mirrored armatures keep per-bone writes
+                for name, head, tail in zip(names, new_heads.tolist(), new_tails.tolist()):
+                    bone = edit_bones[name]
+                    bone.head = head
+                    bone.tail = tail
+            else:
+                heads[selected] = new_heads
+                tails[selected] = new_tails
+                _sync_connected(edit_bones, rows, selected, heads, tails)
+
+                # Two bulk writes instead of a head and tail RNA assignment per bone
+                edit_bones.foreach_set("head", heads.ravel())
+                edit_bones.foreach_set("tail", tails.ravel())
+
+        # Original positions as plain tuples (no long-lived Vectors)
+        original_positions: Dict[str, PositionTuple] = dict(
+            zip(names, map(tuple, original_heads.tolist()))
+        )
         return original_positions
 
+    @requires_armature
     def adjust_proportional(
         self,
         canonical_armature: "bpy.types.Object",
         joint_mapping: JointMapping,
         preserve_bone_length: bool = True,
-    ) -> Dict[str, Vector]:
+    ) -> Dict[str, PositionTuple]:
         """
         Adjust canonical skeleton with proportional scaling.
 
@@ -119,30 +202,21 @@ class CanonicalSkeletonAdjuster:
             preserve_bone_length: Whether to maintain relative bone lengths
 
         Returns:
-            Dictionary of original bone positions
+            Dictionary of original bone head positions as (x, y, z) tuples
         """
-        if not BLENDER_AVAILABLE or bpy is None:
-            raise RuntimeError("Blender API is not available")
-
         # Calculate scaling factors for key dimensions
         scale_factors = self._calculate_scale_factors(joint_mapping)
 
         # Store original positions
-        original_positions: Dict[str, Vector] = {}
-
-        bpy.context.view_layer.objects.active = canonical_armature
-        bpy.ops.object.mode_set(mode="EDIT")
+        original_positions: Dict[str, PositionTuple] = {}
 
-        edit_bones = canonical_armature.data.edit_bones
+        with armature_mode(canonical_armature, "EDIT"):
+            ebones_by_name = {bone.name: bone for bone in canonical_armature.data.edit_bones}
 
-        try:
             # Apply scaling to bone chains
-            self._scale_spine_chain(edit_bones, scale_factors, original_positions)
-            self._scale_arm_chains(edit_bones, scale_factors, original_positions)
-            self._scale_leg_chains(edit_bones, scale_factors, original_positions)
-
-        finally:
-            bpy.ops.object.mode_set(mode="OBJECT")
+            self._scale_spine_chain(ebones_by_name, scale_factors, original_positions)
+            self._scale_arm_chains(ebones_by_name, scale_factors, original_positions)
+            self._scale_leg_chains(ebones_by_name, scale_factors, original_positions)
 
         return original_positions
 
@@ -153,55 +227,37 @@ class CanonicalSkeletonAdjuster:
         """
         Calculate scale factors for different body parts.
 
-        Compares distances between joints in source vs canonical.
+        Would compare distances between joints in source vs canonical. There is
+        no canonical measurement to compare against yet, so every factor whose
+        joint chain is fully mapped is a placeholder 1.0 and nothing is measured.
         """
-        factors: Dict[str, float] = {}
-
         target = joint_mapping.target_positions
-
-        # Shoulder width scale
-        if "clavicle_l" in target and "clavicle_r" in target:
-            source_width = (target["clavicle_l"].position - target["clavicle_r"].position).length
-            # Would compare to canonical width here
-            # For now, use placeholder
-            factors["shoulder_width"] = 1.0
-
-        # Spine height scale
-        if "pelvis" in target and "spine_01" in target:
-            spine_height = (target["pelvis"].position - target["spine_01"].position).length
-            factors["spine_height"] = 1.0
-
-        # Leg length scale
-        if "thigh_l" in target and "calf_l" in target and "foot_l" in target:
-            leg_length = 0.0
-            leg_length += (target["thigh_l"].position - target["calf_l"].position).length
-            leg_length += (target["calf_l"].position - target["foot_l"].position).length
-            factors["leg_length"] = 1.0
-
-        return factors
+        return {
+            factor: 1.0
+            for factor, chain in self._SCALE_CHAINS
+            if all(joint in target for joint in chain)
+        }
 
     def _scale_spine_chain(
         self,
-        edit_bones,
+        ebones_by_name: Dict[str, "bpy.types.EditBone"],
         scale_factors: Dict[str, float],
-        original_positions: Dict[str, Vector],
+        original_positions: Dict[str, PositionTuple],
     ) -> None:
         """Scale spine bone chain proportionally."""
         spine_bones = ["spine_01", "spine_02", "spine_03", "spine_04", "spine_05"]
 
-        scale = scale_factors.get("spine_height", 1.0)
-
         for bone_name in spine_bones:
-            if bone_name in edit_bones:
-                bone = edit_bones[bone_name]
-                original_positions[bone_name] = bone.head.copy()
+            bone = ebones_by_name.get(bone_name)
+            if bone is not None:
+                original_positions[bone_name] = tuple(bone.head)
                 # Apply scaling logic here
 
     def _scale_arm_chains(
         self,
-        edit_bones,
+        ebones_by_name: Dict[str, "bpy.types.EditBone"],
         scale_factors: Dict[str, float],
-        original_positions: Dict[str, Vector],
+        original_positions: Dict[str, PositionTuple],
     ) -> None:
         """Scale arm bone chains proportionally."""
         # Left arm
@@ -210,27 +266,25 @@ class CanonicalSkeletonAdjuster:
         arm_bones_r = ["clavicle_r", "upperarm_r", "lowerarm_r", "hand_r"]
 
         for bone_name in arm_bones_l + arm_bones_r:
-            if bone_name in edit_bones:
-                bone = edit_bones[bone_name]
-                original_positions[bone_name] = bone.head.copy()
+            bone = ebones_by_name.get(bone_name)
+            if bone is not None:
+                original_positions[bone_name] = tuple(bone.head)
                 # Apply scaling logic here
 
     def _scale_leg_chains(
         self,
-        edit_bones,
+        ebones_by_name: Dict[str, "bpy.types.EditBone"],
         scale_factors: Dict[str, float],
-        original_positions: Dict[str, Vector],
+        original_positions: Dict[str, PositionTuple],
     ) -> None:
         """Scale leg bone chains proportionally."""
         leg_bones_l = ["thigh_l", "calf_l", "foot_l", "ball_l"]
         leg_bones_r = ["thigh_r", "calf_r", "foot_r", "ball_r"]
 
-        scale = scale_factors.get("leg_length", 1.0)
-
         for bone_name in leg_bones_l + leg_bones_r:
-            if bone_name in edit_bones:
-                bone = edit_bones[bone_name]
-                original_positions[bone_name] = bone.head.copy()
+            bone = ebones_by_name.get(bone_name)
+            if bone is not None:
+                original_positions[bone_name] = tuple(bone.head)
                 # Apply scaling logic here
 
     def validate_adjustment(
@@ -253,14 +307,17 @@ class CanonicalSkeletonAdjuster:
         errors: list[str] = []
         is_valid = True
 
+        # Read the RNA matrix once rather than once per bone
+        matrix_world = canonical_armature.matrix_world.copy()
+
         for canonical_name, expected_pos in joint_mapping.target_positions.items():
             if canonical_name not in canonical_armature.data.bones:
                 continue
 
             bone = canonical_armature.data.bones[canonical_name]
-            actual_pos = canonical_armature.matrix_world @ bone.head_local
+            actual_pos = matrix_world @ bone.head_local
 
-            distance = (actual_pos - expected_pos.position).length
+            distance = math.dist(actual_pos, expected_pos.position)
 
             if distance > tolerance:
                 is_valid = False
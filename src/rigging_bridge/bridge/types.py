@@ -2,9 +2,14 @@
 Data models and types for the Rig Interop Bridge.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import cached_property
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, TypedDict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 try:
     import bpy
@@ -15,6 +20,9 @@ except ImportError:
     BLENDER_AVAILABLE = False
     Vector = tuple  # type: ignore
 
+# Plain (x, y, z) coordinates, used where a mathutils Vector would be overkill
+PositionTuple = Tuple[float, float, float]
+
 
 class RigType(str, Enum):
     """Supported rig types."""
@@ -37,26 +45,102 @@ class RestPose(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class JointPosition:
     """3D position and metadata for a single joint."""
 
     name: str
     position: Vector
     parent: Optional[str] = None
-    children: List[str] = field(default_factory=list)
+    children: Tuple[str, ...] = ()
+    # Plain copy of position for serialization; positions are fixed once captured
+    _pos_tuple: Optional[PositionTuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
+        pos_tuple = self._pos_tuple
+        if pos_tuple is None:
+            position = self.position
+            pos_tuple = self._pos_tuple = (position[0], position[1], position[2])
         return {
             "name": self.name,
-            "position": tuple(self.position),
+            "position": pos_tuple,
             "parent": self.parent,
             "children": self.children,
         }
 
 
 @dataclass
+class PositionTable:
+    """
+    Columnar store of joint positions.
+
+    Row ``i`` of ``positions`` and ``parent_idx`` belongs to ``names[i]``.
+    Keeps one contiguous array per field instead of one JointPosition object
+    per joint, which suits batch geometry (distances, KD-trees, transforms).
+    """
+
+    names: List[str]
+    positions: "np.ndarray"  # (N, 3) float32, world space
+    parent_idx: "np.ndarray"  # (N,) int32, -1 for roots or when hierarchy was not captured
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_joint_positions(cls, joints: Dict[str, "JointPosition"]) -> "PositionTable":
+        """Collect per-joint positions into a table; parents outside ``joints`` become -1."""
+        # Deferred so that importing the bridge types does not load NumPy
+        import numpy as np
+
+        names = list(joints)
+        positions = np.array(
+            [tuple(joint.position) for joint in joints.values()],
+            dtype=np.float32,
+        ).reshape(-1, 3)
+        index = {name: row for row, name in enumerate(names)}
+        parent_idx = np.fromiter(
+            (index.get(joint.parent, -1) for joint in joints.values()),
+            dtype=np.int32,
+            count=len(names),
+        )
+        return cls(names=names, positions=positions, parent_idx=parent_idx)
+
+    @cached_property
+    def index(self) -> Dict[str, int]:
+        """Row index by joint name."""
+        return {name: row for row, name in enumerate(self.names)}
+
+    def to_joint_positions(self, include_hierarchy: bool = False) -> Dict[str, JointPosition]:
+        """Expand into the per-joint form used by JointMapping."""
+        # One bulk conversion to Python floats instead of one per-row array view
+        rows = self.positions.tolist()
+        if not include_hierarchy:
+            return {
+                name: JointPosition(name=name, position=Vector(row))
+                for name, row in zip(self.names, rows)
+            }
+
+        parents = self.parent_idx.tolist()
+        children: Dict[int, List[str]] = {}
+        for row, parent in enumerate(parents):
+            if parent >= 0:
+                children.setdefault(parent, []).append(self.names[row])
+
+        return {
+            name: JointPosition(
+                name=name,
+                position=Vector(rows[row]),
+                parent=self.names[parents[row]] if parents[row] >= 0 else None,
+                children=tuple(children.get(row, ())),
+            )
+            for row, name in enumerate(self.names)
+        }
+
+
+@dataclass(slots=True)
 class RigMetadata:
     """Metadata about a detected rig."""
 
@@ -69,17 +153,13 @@ class RigMetadata:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        return {
-            "rig_type": self.rig_type.value,
-            "rest_pose": self.rest_pose.value,
-            "bone_count": self.bone_count,
-            "confidence": self.confidence,
-            "detected_bones": self.detected_bones,
-            "extra_metadata": self.extra_metadata,
-        }
+        data = dict(zip(_RIG_METADATA_FIELDS, _get_rig_metadata_fields(self)))
+        data["rig_type"] = self.rig_type.value
+        data["rest_pose"] = self.rest_pose.value
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class JointMapping:
     """Mapping between source and target joint positions."""
 
@@ -87,6 +167,21 @@ class JointMapping:
     target_positions: Dict[str, JointPosition]
     unmapped_source: List[str] = field(default_factory=list)
     unmapped_target: List[str] = field(default_factory=list)
+    _target_table: Optional[PositionTable] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def as_soa(self) -> PositionTable:
+        """
+        Target positions as a columnar PositionTable, built on first use.
+
+        Rows follow ``target_positions`` order. The table is cached, so the
+        mapping is treated as read-only once this has been called.
+        """
+        table = self._target_table
+        if table is None:
+            table = self._target_table = PositionTable.from_joint_positions(self.target_positions)
+        return table
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -98,7 +193,16 @@ class JointMapping:
         }
 
 
-@dataclass
+class TransferStats(TypedDict):
+    """Statistics reported by a weight transfer."""
+
+    method: str
+    vertex_groups_created: int
+    vertex_groups_renamed: int
+    warnings: List[str]
+
+
+@dataclass(slots=True)
 class ConversionResult:
     """Result of a rig conversion operation."""
 
@@ -121,7 +225,7 @@ class ConversionResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionOptions:
     """Configuration options for rig conversion."""
 
@@ -132,17 +236,20 @@ class ConversionOptions:
     remove_fingers: bool = False
     export_textures: bool = True
     validate_weights: bool = True
+    validate_metrics: bool = False  # Record anatomical metrics in rig metadata
     falloff_exponent: float = 20.0  # For weight redistribution
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
-        return {
-            "target_rig_type": self.target_rig_type.value,
-            "target_rest_pose": self.target_rest_pose.value,
-            "preserve_proportions": self.preserve_proportions,
-            "include_extra_bones": self.include_extra_bones,
-            "remove_fingers": self.remove_fingers,
-            "export_textures": self.export_textures,
-            "validate_weights": self.validate_weights,
-            "falloff_exponent": self.falloff_exponent,
-        }
+        data = dict(zip(_CONVERSION_OPTIONS_FIELDS, _get_conversion_options_fields(self)))
+        data["target_rig_type"] = self.target_rig_type.value
+        data["target_rest_pose"] = self.target_rest_pose.value
+        return data
+
+
+# Field names and a C-level getter for every field, generated once from the
+# dataclass definitions so to_dict stays in sync as fields are added
+_RIG_METADATA_FIELDS = tuple(f.name for f in fields(RigMetadata))
+_get_rig_metadata_fields = attrgetter(*_RIG_METADATA_FIELDS)
+_CONVERSION_OPTIONS_FIELDS = tuple(f.name for f in fields(ConversionOptions))
+_get_conversion_options_fields = attrgetter(*_CONVERSION_OPTIONS_FIELDS)
@@ -0,0 +1,95 @@
+"""
+Reusable Blender utilities for the Rig Interop Bridge.
+"""
+
+import functools
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+import numpy as np
+
+try:
+    import bpy
+    BLENDER_AVAILABLE = True
+except ImportError:
+    BLENDER_AVAILABLE = False
+    bpy = None  # type: ignore
+
+F = TypeVar("F", bound=Callable)
+
+
+def requires_armature(method: F) -> F:
+    """
+    Guard a method whose first argument after ``self`` is an armature object.
+
+    Raises RuntimeError when the Blender API is unavailable and ValueError when
+    the object is not an armature, so the decorated body can skip both checks.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, armature, *args, **kwargs):
+        if not BLENDER_AVAILABLE or bpy is None:
+            raise RuntimeError("Blender API is not available")
+
+        if armature.type != "ARMATURE":
+            raise ValueError(f"Object {armature.name} is not an armature")
+
+        return method(self, armature, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def armature_mode(armature: "bpy.types.Object", mode: str) -> Iterator[None]:
+    """
+    Make ``armature`` active in ``mode`` for the duration of the block.
+
+    Every mode switch rebuilds the depsgraph, so nothing is switched when the
+    armature is already active in the requested mode. Otherwise the previous
+    mode is restored on exit. Nested blocks for the same mode therefore cost
+    a single transition.
+
+    Args:
+        armature: Armature object to operate on
+        mode: Target object mode ("EDIT", "POSE", "OBJECT")
+    """
+    view_layer = bpy.context.view_layer
+    if view_layer.objects.active != armature:
+        view_layer.objects.active = armature
+
+    previous_mode = armature.mode
+    if previous_mode == mode:
+        yield
+        return
+
+    bpy.ops.object.mode_set(mode=mode)
+    try:
+        yield
+    finally:
+        bpy.ops.object.mode_set(mode=previous_mode)
+
+
+def world_coords(items, attribute: str, matrix_world) -> np.ndarray:
+    """
+    World-space copy of a vector property on every item of an RNA collection.
+
+    One foreach_get into a float32 buffer and one matmul, instead of a
+    Vector read and multiply per item.
+
+    Args:
+        items: RNA collection, e.g. mesh vertices or armature bones
+        attribute: Local-space vector property to read ("co", "head_local", ...)
+        matrix_world: Object matrix taking the property to world space
+
+    Returns:
+        (N, 3) float32 array, one row per item in collection order
+    """
+    local = np.empty(len(items) * 3, dtype=np.float32)
+    items.foreach_get(attribute, local)
+    matrix = np.asarray(matrix_world, dtype=np.float32)
+    return local.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def world_vertex_coords(obj: "bpy.types.Object") -> np.ndarray:
+    """World-space positions of a mesh object's vertices as a (V, 3) float32 array."""
+    return world_coords(obj.data.vertices, "co", obj.matrix_world)
@@ -8,18 +8,145 @@ This happens AFTER the canonical skeleton has been adjusted to match
 source proportions, ensuring accurate weight projection.
 """
 
-from typing import Dict, List, Optional, Set
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 try:
+    import bmesh
     import bpy
-    from mathutils import Vector, kdtree
+    from mathutils import Vector
     BLENDER_AVAILABLE = True
 except ImportError:
     BLENDER_AVAILABLE = False
+    bmesh = None  # type: ignore
     bpy = None  # type: ignore
     Vector = tuple  # type: ignore
 
-from rigging_bridge.bridge.types import JointMapping
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # Optional speed-up; falls back to a blocked NumPy search
+    cKDTree = None  # type: ignore
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional speed-up; falls back to NumPy broadcasting
+    njit = None  # type: ignore
+    prange = range
+
+from rigging_bridge.bridge.types import JointMapping, TransferStats
+from rigging_bridge.bridge.utils import world_vertex_coords
+
+# Vertices per block in the NumPy nearest-bone fallback, bounding its (block, bones) scratch
+_NEAREST_BLOCK_SIZE = 16384
+
+# Vertex indices listed per validate_weights warning; the rest are only counted
+_MAX_REPORTED_VERTICES = 10
+
+# Falloff weighting: points closer than 0.001 to a bone take a fixed raw weight of 1e10
+_NEAR_SQUARED = np.float32(0.001 ** 2)
+_LOG_NEAR_WEIGHT = np.float32(math.log(1e10))
+
+
+def _format_indices(indices: np.ndarray, values: Optional[np.ndarray] = None) -> str:
+    """First few vertex indices for a warning, each with its value when given."""
+    shown = indices[:_MAX_REPORTED_VERTICES].tolist()
+    if values is None:
+        text = ", ".join(str(index) for index in shown)
+    else:
+        text = ", ".join(f"{index} ({values[index]:.3f})" for index in shown)
+    return f"{text}, ..." if len(indices) > len(shown) else text
+
+
+def _position_key(position) -> Tuple[float, ...]:
+    """Hashable key for a joint position, rounded so float noise does not split matches."""
+    return tuple(round(component, 5) for component in position)
+
+
+def _nearest_indices(points: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest row of ``targets`` for every row of ``points``.
+
+    Uses one batched SciPy KD-tree query when SciPy is installed; otherwise
+    a brute-force search over blocks of points.
+    """
+    if cKDTree is not None:
+        _, indices = cKDTree(targets).query(points, k=1, workers=-1)
+        return indices
+
+    indices = np.empty(len(points), dtype=np.intp)
+    target_norms = np.einsum("ti,ti->t", targets, targets, optimize=True)
+    for start in range(0, len(points), _NEAREST_BLOCK_SIZE):
+        block = points[start : start + _NEAREST_BLOCK_SIZE]
+        # |p - t|^2 without the per-point |p|^2 term, which does not change the argmin
+        distances = target_norms[None, :] - 2.0 * (block @ targets.T)
+        indices[start : start + len(block)] = distances.argmin(axis=1)
+    return indices
+
+
+def _falloff_weights_numpy(points: np.ndarray, bones: np.ndarray, exponent: float) -> np.ndarray:
+    """
+    Normalized inverse-distance weights of every point to every bone, shape (V, B).
+
+    Points within 0.001 of a bone take a fixed 1e10 raw weight. Raw weights are
+    formed in log space and shifted by each row's maximum before exponentiating,
+    which leaves the normalized result unchanged but keeps ``distance ** -exponent``
+    from overflowing the float32 buffers.
+    """
+    # (V, B) squared distances from every vertex to every bone in the chain
+    diff = points[:, None, :] - bones[None, :, :]
+    squared = np.einsum("vbi,vbi->vb", diff, diff, dtype=np.float32, optimize=True)
+
+    # log(distance ** -exponent) == -exponent / 2 * log(distance ** 2)
+    with np.errstate(divide="ignore"):
+        log_raw = np.where(
+            squared > _NEAR_SQUARED,
+            np.float32(-0.5 * exponent) * np.log(squared),
+            _LOG_NEAR_WEIGHT,
+        )
+
+    # Normalize weights; the row maximum becomes exp(0) == 1, so totals are >= 1
+    log_raw -= log_raw.max(axis=1, keepdims=True)
+    raw_weights = np.exp(log_raw, out=log_raw)
+    raw_weights /= raw_weights.sum(axis=1, keepdims=True)
+    return raw_weights
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _falloff_weights_numba(points, bones, exponent):  # pragma: no cover - needs numba
+        """Fused equivalent of _falloff_weights_numpy, parallel over vertices."""
+        vertex_count = points.shape[0]
+        bone_count = bones.shape[0]
+        half_exponent = np.float32(0.5 * exponent)
+        weights = np.empty((vertex_count, bone_count), dtype=np.float32)
+        for v in prange(vertex_count):
+            peak = -np.inf
+            for b in range(bone_count):
+                dx = points[v, 0] - bones[b, 0]
+                dy = points[v, 1] - bones[b, 1]
+                dz = points[v, 2] - bones[b, 2]
+                squared = dx * dx + dy * dy + dz * dz
+                if squared > _NEAR_SQUARED:
+                    log_raw = -half_exponent * np.log(squared)
+                else:
+                    log_raw = _LOG_NEAR_WEIGHT
+                weights[v, b] = log_raw
+                peak = max(peak, log_raw)
+            total = 0.0
+            for b in range(bone_count):
+                raw = np.exp(weights[v, b] - peak)
+                weights[v, b] = raw
+                total += raw
+            for b in range(bone_count):
+                weights[v, b] /= total
+        return weights
+
+    _falloff_weights = _falloff_weights_numba
+else:
+    _falloff_weights = _falloff_weights_numpy
 
 
 class WeightTransfer:
@@ -42,7 +169,7 @@ class WeightTransfer:
         target_armature: "bpy.types.Object",
         joint_mapping: JointMapping,
         method: str = "hybrid",
-    ) -> Dict[str, any]:
+    ) -> TransferStats:
         """
         Transfer vertex weights from source mesh to target armature.
 
@@ -64,24 +191,27 @@ class WeightTransfer:
         if target_armature.type != "ARMATURE":
             raise ValueError(f"Object {target_armature.name} is not an armature")
 
-        stats = {
+        stats: TransferStats = {
             "method": method,
             "vertex_groups_created": 0,
             "vertex_groups_renamed": 0,
             "warnings": [],
         }
 
-        if method == "name":
-            self._transfer_by_name(source_mesh, target_armature, joint_mapping, stats)
-        elif method == "proximity":
-            self._transfer_by_proximity(source_mesh, target_armature, joint_mapping, stats)
-        elif method == "hybrid":
-            # Try name-based first, fall back to proximity
-            self._transfer_by_name(source_mesh, target_armature, joint_mapping, stats)
-            self._transfer_by_proximity(source_mesh, target_armature, joint_mapping, stats)
-        else:
+        if method not in ("name", "proximity", "hybrid"):
             raise ValueError(f"Unknown transfer method: {method}")
 
+        # Vertex group names, collected once and kept current by both passes
+        existing = {group.name for group in source_mesh.vertex_groups}
+
+        if method in ("name", "hybrid"):
+            # Try name-based first, fall back to proximity
+            self._transfer_by_name(source_mesh, target_armature, joint_mapping, stats, existing)
+        if method in ("proximity", "hybrid"):
+            self._transfer_by_proximity(
+                source_mesh, target_armature, joint_mapping, stats, existing
+            )
+
         return stats
 
     def _transfer_by_name(
@@ -89,30 +219,42 @@ class WeightTransfer:
         source_mesh: "bpy.types.Object",
         target_armature: "bpy.types.Object",
         joint_mapping: JointMapping,
-        stats: Dict[str, any],
+        stats: TransferStats,
+        existing: Optional[Set[str]] = None,
     ) -> None:
         """
         Transfer weights by renaming vertex groups to match canonical bones.
 
         This is the simplest approach: if source has a vertex group that
         matches a source bone name, rename it to the canonical bone name.
+
+        ``existing`` is the set of current vertex group names; it is read
+        from the mesh when not given and updated in place on every rename.
         """
+        # Index source bones by position; the first bone at a position wins
+        source_by_position: Dict[Tuple[float, ...], str] = {}
+        for source_name, source_pos in joint_mapping.source_positions.items():
+            source_by_position.setdefault(_position_key(source_pos.position), source_name)
+
         # Build reverse mapping: source bone name -> canonical bone name
         name_map: Dict[str, str] = {}
 
         for canonical_name, target_pos in joint_mapping.target_positions.items():
-            # Find which source bone(s) map to this canonical bone
-            for source_name, source_pos in joint_mapping.source_positions.items():
-                if target_pos.position == source_pos.position:
-                    name_map[source_name] = canonical_name
-                    break
+            # Find which source bone maps to this canonical bone
+            source_name = source_by_position.get(_position_key(target_pos.position))
+            if source_name is not None:
+                name_map[source_name] = canonical_name
 
         # Rename vertex groups
+        if existing is None:
+            existing = {group.name for group in source_mesh.vertex_groups}
         for vgroup in source_mesh.vertex_groups:
-            if vgroup.name in name_map:
-                new_name = name_map[vgroup.name]
-                if new_name not in [g.name for g in source_mesh.vertex_groups]:
+            new_name = name_map.get(vgroup.name)
+            if new_name is not None:
+                if new_name not in existing:
+                    existing.discard(vgroup.name)
                     vgroup.name = new_name
+                    existing.add(new_name)
                     stats["vertex_groups_renamed"] += 1
                 else:
                     # Merge weights if target group already exists
@@ -125,7 +267,8 @@ class WeightTransfer:
         source_mesh: "bpy.types.Object",
         target_armature: "bpy.types.Object",
         joint_mapping: JointMapping,
-        stats: Dict[str, any],
+        stats: TransferStats,
+        existing: Optional[Set[str]] = None,
     ) -> None:
         """
         Transfer weights using proximity to bones.
@@ -134,41 +277,37 @@ class WeightTransfer:
         and assign weights accordingly.
 
         This is useful when source and target bone names don't match.
+        ``existing`` works as in _transfer_by_name and gains every group
+        created here.
         """
-        # Build KD-tree of target bone positions
-        size = len(joint_mapping.target_positions)
-        kd = kdtree.KDTree(size)
+        if not joint_mapping.target_positions:
+            return
 
-        bone_lookup: List[str] = []
-        for idx, (bone_name, joint_pos) in enumerate(joint_mapping.target_positions.items()):
-            kd.insert(joint_pos.position, idx)
-            bone_lookup.append(bone_name)
+        if not len(source_mesh.data.vertices):
+            return
 
-        kd.balance()
+        # Columnar target positions, cached on the mapping across calls
+        target_table = joint_mapping.as_soa()
+        bone_lookup = target_table.names
+        bone_positions = target_table.positions
 
-        # For each vertex without weights, assign to nearest bone
-        # This is a simplified version - production would be more sophisticated
-        for vertex in source_mesh.data.vertices:
-            world_pos = source_mesh.matrix_world @ vertex.co
+        world_coords = world_vertex_coords(source_mesh)
 
-            # Find nearest bone
-            nearest_pos, nearest_idx, nearest_dist = kd.find(world_pos)
+        # Find the nearest bone of every vertex in one batched query
+        nearest = _nearest_indices(world_coords, bone_positions)
 
-            if nearest_idx is not None:
-                bone_name = bone_lookup[nearest_idx]
-
-                # Check if vertex already has weight for this bone
-                has_weight = False
-                for group in vertex.groups:
-                    vgroup = source_mesh.vertex_groups[group.group]
-                    if vgroup.name == bone_name:
-                        has_weight = True
-                        break
-
-                # Add vertex group if needed
-                if not has_weight and bone_name not in [g.name for g in source_mesh.vertex_groups]:
-                    source_mesh.vertex_groups.new(name=bone_name)
-                    stats["vertex_groups_created"] += 1
+        # Each bone that is nearest to some vertex needs a vertex group. Bones are
+        # visited in order of first appearance, matching the old per-vertex walk.
+        # This is a simplified version - production would be more sophisticated
+        unique_bones, first_seen = np.unique(nearest, return_index=True)
+        if existing is None:
+            existing = {group.name for group in source_mesh.vertex_groups}
+        for bone_idx in unique_bones[np.argsort(first_seen)].tolist():
+            bone_name = bone_lookup[bone_idx]
+            if bone_name not in existing:
+                source_mesh.vertex_groups.new(name=bone_name)
+                existing.add(bone_name)
+                stats["vertex_groups_created"] += 1
 
     def swap_armature(
         self,
@@ -220,6 +359,9 @@ class WeightTransfer:
             armature: Armature containing the bone chain
             bone_chain: List of bone names in order (e.g., spine bones)
             falloff_exponent: Controls weight falloff curve sharpness
+
+        The mesh must not be in edit mode, since weights are written to its
+        data through bmesh.
         """
         if not BLENDER_AVAILABLE or bpy is None:
             raise RuntimeError("Blender API is not available")
@@ -229,38 +371,44 @@ class WeightTransfer:
             if bone_name not in mesh.vertex_groups:
                 mesh.vertex_groups.new(name=bone_name)
 
-        # Get bone positions along chain
+        # Get bone positions along chain (only bones the armature actually has)
+        chain_names: List[str] = []
         bone_positions: List[Vector] = []
+        armature_matrix = armature.matrix_world.copy()
         for bone_name in bone_chain:
             if bone_name in armature.data.bones:
                 bone = armature.data.bones[bone_name]
-                world_pos = armature.matrix_world @ bone.head_local
-                bone_positions.append(world_pos)
-
-        # For each vertex, calculate weights based on distance to each bone
-        for vertex in mesh.data.vertices:
-            world_pos = mesh.matrix_world @ vertex.co
-
-            # Calculate distances to each bone in chain
-            distances = [
-                (world_pos - bone_pos).length
-                for bone_pos in bone_positions
-            ]
-
-            # Convert distances to weights using inverse distance with falloff
-            raw_weights = [
-                1.0 / (dist ** falloff_exponent) if dist > 0.001 else 1e10
-                for dist in distances
-            ]
-
-            # Normalize weights
-            total_weight = sum(raw_weights)
-            normalized_weights = [w / total_weight for w in raw_weights]
-
-            # Assign weights to vertex groups
-            for bone_name, weight in zip(bone_chain, normalized_weights):
-                vgroup = mesh.vertex_groups[bone_name]
-                vgroup.add([vertex.index], weight, "REPLACE")
+                chain_names.append(bone_name)
+                bone_positions.append(armature_matrix @ bone.head_local)
+
+        if not chain_names or not len(mesh.data.vertices):
+            return
+
+        world_coords = world_vertex_coords(mesh)
+
+        # (V, B) normalized inverse-distance weights
+        normalized_weights = _falloff_weights(
+            world_coords,
+            np.asarray(bone_positions, dtype=np.float32),
+            float(falloff_exponent),
+        )
+
+        # Assign weights through the bmesh deform layer: plain item writes on each
+        # vertex's deform dict instead of one VertexGroup.add RNA call per
+        # (vertex, bone). Deform layers are keyed by vertex group index.
+        group_indices = [mesh.vertex_groups[bone_name].index for bone_name in chain_names]
+        bm = bmesh.new()
+        try:
+            bm.from_mesh(mesh.data)
+            deform = bm.verts.layers.deform.verify()
+            for vert, row in zip(bm.verts, normalized_weights.tolist()):
+                deform_weights = vert[deform]
+                for group_index, weight in zip(group_indices, row):
+                    deform_weights[group_index] = weight
+            bm.to_mesh(mesh.data)
+        finally:
+            bm.free()
+        mesh.data.update()
 
     def validate_weights(
         self,
@@ -287,28 +435,44 @@ class WeightTransfer:
 
         bone_names = {bone.name for bone in armature.data.bones}
 
-        # Check vertex groups match bones
-        for vgroup in mesh.vertex_groups:
-            if vgroup.name not in bone_names:
-                warnings.append(f"Vertex group '{vgroup.name}' has no matching bone")
+        # Check vertex groups match bones: one set difference, then report the
+        # unmatched groups in mesh order
+        group_names = [vgroup.name for vgroup in mesh.vertex_groups]
+        unmatched = set(group_names) - bone_names
+        if unmatched:
+            warnings.extend(
+                f"Vertex group '{name}' has no matching bone"
+                for name in group_names
+                if name in unmatched
+            )
+
+        # Influence counts and weight totals for every vertex, gathered in one pass
+        vertices = mesh.data.vertices
+        vertex_count = len(vertices)
+        influence_counts = np.empty(vertex_count, dtype=np.int32)
+        weight_totals = np.empty(vertex_count, dtype=np.float32)
+        for index, vertex in enumerate(vertices):
+            groups = vertex.groups
+            influence_counts[index] = len(groups)
+            weight_totals[index] = sum(group.weight for group in groups)
 
         # Check all vertices have weights
-        for vertex in mesh.data.vertices:
-            if len(vertex.groups) == 0:
-                warnings.append(f"Vertex {vertex.index} has no weights")
-                is_valid = False
-
-        # Check weight normalization (sample 100 vertices)
-        import random
-        sample_size = min(100, len(mesh.data.vertices))
-        sample_indices = random.sample(range(len(mesh.data.vertices)), sample_size)
-
-        for idx in sample_indices:
-            vertex = mesh.data.vertices[idx]
-            total_weight = sum(group.weight for group in vertex.groups)
-            if abs(total_weight - 1.0) > 0.01:
-                warnings.append(
-                    f"Vertex {idx} weights not normalized: {total_weight:.3f}"
-                )
+        weighted = influence_counts > 0
+        unweighted = np.flatnonzero(~weighted)
+        if unweighted.size:
+            is_valid = False
+            warnings.append(
+                f"Vertices with no weights: {unweighted.size} "
+                f"(first: {_format_indices(unweighted)})"
+            )
+
+        # Check weight normalization on every weighted vertex rather than a random
+        # sample; unweighted vertices were already reported above
+        unnormalized = np.flatnonzero(weighted & (np.abs(weight_totals - 1.0) > 0.01))
+        if unnormalized.size:
+            warnings.append(
+                f"Vertices with unnormalized weights: {unnormalized.size} "
+                f"(first: {_format_indices(unnormalized, weight_totals)})"
+            )
 
         return is_valid, warnings
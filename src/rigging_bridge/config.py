@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -15,8 +15,16 @@ class AppSettings(BaseSettings):
     input_bucket: Optional[str] = None
     output_bucket: Optional[str] = None
     work_dir: Path = Field(default=Path("/tmp/rig-transformer"))
+    cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached conversion outputs; unset disables caching",
+    )
     blender_python: Path = Field(default=Path("/usr/local/blender/4.5/python/bin/python3.11"))
     blender_executable: Path = Field(default=Path("/usr/local/blender/blender"))
+    blender_workers: int = Field(
+        default=0,
+        description="Persistent Blender worker processes; 0 spawns Blender per conversion",
+    )
 
     model_config = {
         "env_file": (".env", ".env.local", str(Path(__file__).parent.parent.parent / ".env")),
@@ -25,10 +33,17 @@ class AppSettings(BaseSettings):
     }
 
 
+@cache
+def _ensure_workdir(path: Path) -> None:
+    """Create ``path`` once per process, however often settings are rebuilt."""
+
+    path.mkdir(parents=True, exist_ok=True)
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
     """Return cached application settings."""
 
     settings = AppSettings()
-    settings.work_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_workdir(settings.work_dir)
     return settings
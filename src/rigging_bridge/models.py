@@ -17,6 +17,10 @@ class ConversionRequest(BaseModel):
     t_pose: bool = Field(default=True)
     export_textures: bool = Field(default=True)
     remove_fingers: bool = Field(default=True)
+    wait: bool = Field(
+        default=True,
+        description="Block until conversion finishes; when false, poll /v1/status/{job_id}",
+    )
 
     @field_validator("source_uri")
     @classmethod
@@ -34,5 +38,7 @@ class ConversionArtifact(BaseModel):
 
 class ConversionResponse(BaseModel):
     status: str
+    job_id: Optional[str] = None
     artifacts: list[ConversionArtifact]
     logs: Optional[list[str]] = None
+    cache_hit: bool = False
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+from loguru import logger
+
+from rigging_bridge import __version__
+from rigging_bridge.models import ConversionRequest
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speed-up
+    xxhash = None  # type: ignore
+
+_CHUNK_SIZE = 1024 * 1024
+
+# Code that shapes the converted output: the Blender script and the bridge it drives
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+_CONVERTER_PACKAGES = ("blender", "bridge")
+
+# Request fields that change the converted output; URIs are deliberately excluded
+_OPTION_FIELDS = (
+    "collection",
+    "include_extra_bones",
+    "t_pose",
+    "export_textures",
+    "remove_fingers",
+)
+
+
+def _new_hasher():
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+@lru_cache(maxsize=1)
+def _converter_fingerprint() -> bytes:
+    """Digest of the package version and converter sources.
+
+    Mixed into every cache key so a deploy that changes the converter does
+    not keep serving artifacts produced by the old code from a persistent
+    cache directory.
+    """
+    hasher = _new_hasher()
+    hasher.update(__version__.encode())
+    for package in _CONVERTER_PACKAGES:
+        for source in sorted((_PACKAGE_ROOT / package).glob("*.py")):
+            hasher.update(source.relative_to(_PACKAGE_ROOT).as_posix().encode())
+            hasher.update(source.read_bytes())
+    return hasher.digest()
+
+
+class ConversionCache:
+    """Disk cache of converted artifacts keyed by input content and options.
+
+    Each entry is a directory named after the key holding the artifacts of
+    one successful conversion.
+    """
+
+    def __init__(self, root: Path, salt: Optional[bytes] = None) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._salt = _converter_fingerprint() if salt is None else salt
+
+    def key_for(self, input_path: Path, request: ConversionRequest) -> str:
+        hasher = _new_hasher()
+        hasher.update(self._salt)
+        with input_path.open("rb") as handle:
+            while chunk := handle.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+
+        options = {name: getattr(request, name) for name in _OPTION_FIELDS}
+        hasher.update(json.dumps(options, sort_keys=True).encode())
+        return hasher.hexdigest()
+
+    def lookup(self, key: str) -> Optional[Path]:
+        entry = self.root / key
+        return entry if entry.is_dir() else None
+
+    def store(self, key: str, output_dir: Path) -> None:
+        entry = self.root / key
+        if entry.exists():
+            return
+
+        # Populate a scratch directory first so readers never see a partial entry
+        staging = self.root / f".{key}.{uuid4().hex}"
+        staging.mkdir()
+        for artifact in output_dir.glob("*.glb"):
+            shutil.copyfile(artifact, staging / artifact.name)
+        metadata = output_dir / "scene_data.json"
+        if metadata.exists():
+            shutil.copyfile(metadata, staging / metadata.name)
+
+        try:
+            staging.rename(entry)
+        except OSError:
+            # Another conversion stored the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+        else:
+            logger.debug("Cached conversion output under {}", entry)
+
+
+__all__ = ["ConversionCache"]
@@ -1,22 +1,94 @@
 from __future__ import annotations
 
+import asyncio
+import errno
 import os
 import shlex
 import shutil
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from uuid import uuid4
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Iterable, Optional
-from urllib.parse import urlparse
+from typing import IO, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from loguru import logger
 
 from rigging_bridge.config import AppSettings, get_settings
 from rigging_bridge.models import ConversionArtifact, ConversionRequest, ConversionResponse
+from rigging_bridge.services.cache import ConversionCache
+from rigging_bridge.services.jobs import JobRegistry
+from rigging_bridge.services.worker_pool import BlenderWorkerPool
+
+
+# Multipart, multi-threaded transfers so large GLBs move over parallel ranged requests
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=max(8, (os.cpu_count() or 1) * 2),
+    use_threads=True,
+)
+
+# Most recent lines kept per Blender output stream; older lines are only logged
+_MAX_LOG_LINES = 10_000
+
+
+@lru_cache(maxsize=256)
+def _split_s3_uri(uri: str) -> tuple[str, str]:
+    """Split ``s3://bucket/key`` into ``(bucket, key)``.
+
+    Cached because artifact dispatch splits the same destination once per file.
+    """
+    if uri[:5] != "s3://":
+        msg = f"Invalid S3 URI: {uri}"
+        raise ValueError(msg)
+    bucket, _, key = uri[5:].partition("/")
+    if not bucket:
+        msg = f"Invalid S3 URI: {uri}"
+        raise ValueError(msg)
+    return bucket, key.lstrip("/")
+
+
+# Hard-link failures that mean "copy instead": other device, no permission, link limit
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK})
+
+
+def _drain(stream: IO[str], sink: deque[str]) -> None:
+    """Forward each line of ``stream`` to the debug log and keep the tail in ``sink``."""
+    with stream:
+        for line in stream:
+            line = line.rstrip("\n")
+            sink.append(line)
+            logger.debug("blender: {}", line)
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link ``source`` to ``target``, copying only when a link is impossible.
+
+    A link shares the data without moving a byte, which is the common case of
+    artifacts and work_dir on one device. The link or copy is made under a
+    fresh temporary name next to ``target`` and then renamed over it, so an
+    existing target, possibly a hard link to a cached artifact, is replaced
+    and never written through, even when another dispatch races for it.
+    """
+    staging = target.with_name(f".{target.name}.{uuid4().hex}")
+    try:
+        try:
+            os.link(source, staging)
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            shutil.copyfile(source, staging)
+        os.replace(staging, target)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
 
 
 class BlenderConversionError(RuntimeError):
@@ -30,13 +102,75 @@ class ConversionResult:
 
 
 class ConversionService:
-    """Coordinate Blender based rig conversions."""
+    """Coordinate Blender based rig conversions.
+
+    A single instance is shared by the API for the lifetime of the app, so it
+    holds no per-request state and is safe to call from concurrent threads.
+    """
 
-    def __init__(self, settings: Optional[AppSettings] = None) -> None:
+    def __init__(
+        self,
+        settings: Optional[AppSettings] = None,
+        worker_pool: Optional[BlenderWorkerPool] = None,
+    ) -> None:
         self.settings = settings or get_settings()
         self._s3_client = None
+        # Invariant parts of every Blender launch, resolved once per service
+        self._command_prefix = (
+            str(self.settings.blender_executable),
+            "-b",
+            "-P",
+            str(self._blender_script()),
+            "--",
+        )
+        self._pythonpath = self._build_pythonpath()
+        if worker_pool is None and self.settings.blender_workers > 0:
+            worker_pool = BlenderWorkerPool(
+                self._build_server_command(),
+                size=self.settings.blender_workers,
+                env=self._blender_env(),
+            )
+        self._worker_pool = worker_pool
+        self._cache = ConversionCache(self.settings.cache_dir) if self.settings.cache_dir else None
+
+    async def convert_async(
+        self,
+        request: ConversionRequest,
+        job_id: Optional[str] = None,
+    ) -> ConversionResponse:
+        """Run :meth:`convert` without blocking the event loop."""
+        return await asyncio.to_thread(self.convert, request, job_id)
 
-    def convert(self, request: ConversionRequest) -> ConversionResponse:
+    async def run_job(
+        self,
+        job_id: str,
+        request: ConversionRequest,
+        registry: JobRegistry,
+    ) -> None:
+        """Run a background conversion, recording its progress in ``registry``."""
+        registry.update(job_id, ConversionResponse(status="RUNNING", artifacts=[], job_id=job_id))
+        try:
+            response = await self.convert_async(request, job_id)
+        except Exception as exc:  # noqa: BLE001 - surfaced through the job status
+            logger.exception("Background conversion {} failed", job_id)
+            response = ConversionResponse(
+                status="FAILED",
+                artifacts=[],
+                logs=[str(exc)],
+                job_id=job_id,
+            )
+        registry.update(job_id, response)
+
+    def close(self) -> None:
+        """Shut down any persistent Blender workers."""
+        if self._worker_pool is not None:
+            self._worker_pool.close()
+
+    def convert(
+        self,
+        request: ConversionRequest,
+        job_id: Optional[str] = None,
+    ) -> ConversionResponse:
         logger.info("Starting conversion for {source}", source=request.source_uri)
 
         with TemporaryDirectory(prefix="rig-transformer-") as temp_dir:
@@ -45,45 +179,50 @@ class ConversionService:
             output_dir = working_dir / "output"
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            job_id = uuid4().hex
+            job_id = job_id or uuid4().hex
             destination_uri = request.output_uri or self._default_output_uri(job_id)
 
-            cmd = self._build_blender_command(request, input_path, output_dir)
-            logger.debug("Executing Blender command: {}", " ".join(shlex.quote(part) for part in cmd))
-
-            env = os.environ.copy()
-            src_root = str(Path(__file__).resolve().parents[1])
-            if env.get("PYTHONPATH"):
-                env["PYTHONPATH"] = os.pathsep.join([src_root, env["PYTHONPATH"]])
+            cache_key: Optional[str] = None
+            if self._cache is not None:
+                cache_key = self._cache.key_for(input_path, request)
+                cached_dir = self._cache.lookup(cache_key)
+                if cached_dir is not None:
+                    logger.info("Reusing cached conversion {}", cache_key)
+                    artifacts = self._collect_artifacts(cached_dir, destination_uri)
+                    return ConversionResponse(
+                        status="COMPLETED",
+                        artifacts=artifacts,
+                        logs=[f"Reused cached conversion {cache_key}"],
+                        cache_hit=True,
+                        job_id=job_id,
+                    )
+
+            script_args = self._build_blender_args(request, input_path, output_dir)
+            if self._worker_pool is not None:
+                logger.debug("Dispatching Blender job to worker pool: {}", " ".join(script_args))
+                returncode, logs = self._worker_pool.run(script_args, cwd=working_dir)
+                error_output = "\n".join(logs[-20:])
             else:
-                env["PYTHONPATH"] = src_root
-            logger.debug("Setting PYTHONPATH to: {}", env["PYTHONPATH"])
-
-            completed = subprocess.run(
-                cmd,
-                cwd=working_dir,
-                check=False,
-                text=True,
-                capture_output=True,
-                env=env,
-            )
-
-            logs: list[str] = []
-            if completed.stdout:
-                logs.extend(completed.stdout.splitlines())
-            if completed.stderr:
-                logs.extend(completed.stderr.splitlines())
+                returncode, logs, error_output = self._run_blender(script_args, working_dir)
 
-            if completed.returncode != 0:
-                logger.error("Blender exited with status {}", completed.returncode)
+            if returncode != 0:
+                logger.error("Blender exited with status {}", returncode)
                 raise BlenderConversionError(
-                    f"Blender exited with status {completed.returncode}: {completed.stderr}"
+                    f"Blender exited with status {returncode}: {error_output}"
                 )
 
-            artifacts = list(self._collect_artifacts(output_dir, destination_uri))
+            if cache_key is not None:
+                self._cache.store(cache_key, output_dir)
+
+            artifacts = self._collect_artifacts(output_dir, destination_uri)
             logger.info("Conversion complete with %d artifact(s)", len(artifacts))
 
-            return ConversionResponse(status="COMPLETED", artifacts=artifacts, logs=logs)
+            return ConversionResponse(
+                status="COMPLETED",
+                artifacts=artifacts,
+                logs=logs,
+                job_id=job_id,
+            )
 
     def _default_output_uri(self, job_id: str) -> Optional[str]:
         bucket = self.settings.output_bucket
@@ -93,13 +232,56 @@ class ConversionService:
 
     # Internal helpers -------------------------------------------------
 
+    def _run_blender(self, script_args: list[str], working_dir: Path) -> tuple[int, list[str], str]:
+        cmd = self._build_blender_command(script_args)
+        logger.debug("Executing Blender command: {}", " ".join(shlex.quote(part) for part in cmd))
+
+        process = subprocess.Popen(
+            cmd,
+            cwd=working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=self._blender_env(),
+        )
+
+        # Drain both pipes while Blender runs so output is logged live and
+        # memory stays bounded, rather than buffering everything until exit
+        stdout_lines: deque[str] = deque(maxlen=_MAX_LOG_LINES)
+        stderr_lines: deque[str] = deque(maxlen=_MAX_LOG_LINES)
+        readers = [
+            threading.Thread(target=_drain, args=(process.stdout, stdout_lines), daemon=True),
+            threading.Thread(target=_drain, args=(process.stderr, stderr_lines), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        returncode = process.wait()
+        for reader in readers:
+            reader.join()
+
+        logs = [*stdout_lines, *stderr_lines]
+        return returncode, logs, "\n".join(stderr_lines)
+
+    def _blender_env(self) -> dict[str, str]:
+        env = os.environ.copy()
+        env["PYTHONPATH"] = self._pythonpath
+        return env
+
+    def _build_pythonpath(self) -> str:
+        src_root = str(Path(__file__).resolve().parents[1])
+        existing = os.environ.get("PYTHONPATH")
+        pythonpath = os.pathsep.join([src_root, existing]) if existing else src_root
+        logger.debug("Setting PYTHONPATH to: {}", pythonpath)
+        return pythonpath
+
     def _materialise_input(self, uri: str, working_dir: Path) -> Path:
         if self._is_s3_uri(uri):
             bucket, key = self._split_s3_uri(uri)
             filename = Path(key).name
             destination = working_dir / filename
             logger.debug("Downloading input from S3 %s to %s", uri, destination)
-            self._s3().download_file(bucket, key, str(destination))
+            self._s3().download_file(bucket, key, str(destination), Config=_S3_TRANSFER_CONFIG)
             return destination
 
         # Assume local path otherwise
@@ -116,10 +298,22 @@ class ConversionService:
         self,
         output_dir: Path,
         destination_uri: Optional[str],
-    ) -> Iterable[ConversionArtifact]:
+    ) -> list[ConversionArtifact]:
         files = sorted(output_dir.glob("*.glb"))
-        for file_path in files:
-            yield self._dispatch_artifact(file_path, destination_uri)
+        if len(files) <= 1:
+            return [self._dispatch_artifact(file_path, destination_uri) for file_path in files]
+
+        if destination_uri and self._is_s3_uri(destination_uri):
+            # Create the shared (thread-safe) client up front so workers don't race to build it
+            self._s3()
+
+        # Uploads block on the network with the GIL released, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            dispatched = executor.map(
+                lambda file_path: self._dispatch_artifact(file_path, destination_uri),
+                files,
+            )
+            return list(dispatched)
 
     def _dispatch_artifact(
         self,
@@ -132,7 +326,12 @@ class ConversionService:
                 key_prefix = f"{key_prefix}/"
             target_key = f"{key_prefix}{artifact_path.name}" if key_prefix else artifact_path.name
             logger.debug("Uploading artifact %s to s3://%s/%s", artifact_path, bucket, target_key)
-            self._s3().upload_file(str(artifact_path), bucket, target_key)
+            self._s3().upload_file(
+                str(artifact_path),
+                bucket,
+                target_key,
+                Config=_S3_TRANSFER_CONFIG,
+            )
             return ConversionArtifact(
                 uri=f"s3://{bucket}/{target_key}",
                 content_type="model/gltf-binary",
@@ -146,23 +345,23 @@ class ConversionService:
 
         target_dir.mkdir(parents=True, exist_ok=True)
         target_path = target_dir / artifact_path.name
-        logger.debug("Copying artifact %s to %s", artifact_path, target_path)
-        shutil.copy2(artifact_path, target_path)
+        logger.debug("Linking artifact %s to %s", artifact_path, target_path)
+        _link_or_copy(artifact_path, target_path)
         return ConversionArtifact(uri=str(target_path), content_type="model/gltf-binary")
 
-    def _build_blender_command(
+    def _build_blender_command(self, script_args: list[str]) -> list[str]:
+        return [*self._command_prefix, *script_args]
+
+    def _build_server_command(self) -> list[str]:
+        return self._build_blender_command(["--server-mode"])
+
+    def _build_blender_args(
         self,
         request: ConversionRequest,
         input_path: Path,
         output_dir: Path,
     ) -> list[str]:
-        script_path = self._blender_script()
-        command = [
-            str(self.settings.blender_executable),
-            "-b",
-            "-P",
-            str(script_path),
-            "--",
+        args = [
             "--input",
             str(input_path),
             "--output-dir",
@@ -170,17 +369,17 @@ class ConversionService:
         ]
 
         if request.collection:
-            command.extend(["--collection", request.collection])
+            args.extend(["--collection", request.collection])
         if request.include_extra_bones:
-            command.append("--include-extra-bones")
+            args.append("--include-extra-bones")
         if not request.t_pose:
-            command.append("--skip-t-pose")
+            args.append("--skip-t-pose")
         if not request.export_textures:
-            command.append("--skip-textures")
+            args.append("--skip-textures")
         if not request.remove_fingers:
-            command.append("--keep-fingers")
+            args.append("--keep-fingers")
 
-        return command
+        return args
 
     def _blender_script(self) -> Path:
         from importlib import resources
@@ -189,15 +388,10 @@ class ConversionService:
         return Path(script)
 
     def _is_s3_uri(self, uri: str) -> bool:
-        return uri.startswith("s3://")
+        return uri[:5] == "s3://"
 
     def _split_s3_uri(self, uri: str) -> tuple[str, str]:
-        parsed = urlparse(uri)
-        if parsed.scheme != "s3" or not parsed.netloc:
-            msg = f"Invalid S3 URI: {uri}"
-            raise ValueError(msg)
-        key = parsed.path.lstrip("/")
-        return parsed.netloc, key
+        return _split_s3_uri(uri)
 
     def _s3(self):
         if self._s3_client is None:
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+from uuid import uuid4
+
+from rigging_bridge.models import ConversionResponse
+
+
+class JobRegistry:
+    """In-memory record of background conversion jobs.
+
+    Only the most recent ``max_jobs`` entries are kept; older ones are
+    forgotten once the limit is reached.
+    """
+
+    def __init__(self, max_jobs: int = 1024) -> None:
+        self._max_jobs = max_jobs
+        self._jobs: OrderedDict[str, ConversionResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self) -> str:
+        job_id = uuid4().hex
+        self.update(job_id, ConversionResponse(status="PENDING", artifacts=[], job_id=job_id))
+        return job_id
+
+    def update(self, job_id: str, response: ConversionResponse) -> None:
+        with self._lock:
+            self._jobs[job_id] = response
+            self._jobs.move_to_end(job_id)
+            while len(self._jobs) > self._max_jobs:
+                self._jobs.popitem(last=False)
+
+    def get(self, job_id: str) -> Optional[ConversionResponse]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+__all__ = ["JobRegistry"]
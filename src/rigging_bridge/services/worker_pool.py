@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from typing import Mapping, Optional, Sequence
+
+from loguru import logger
+
+from rigging_bridge.blender import WORKER_RESULT_PREFIX
+
+
+class BlenderWorker:
+    """A long-lived Blender process running ``run_conversion.py`` in server mode."""
+
+    def __init__(self, command: Sequence[str], env: Optional[Mapping[str, str]] = None) -> None:
+        logger.debug("Starting Blender worker: {}", " ".join(command))
+        self._process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=dict(env) if env is not None else None,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def run(self, args: Sequence[str], cwd: Path) -> tuple[int, list[str]]:
+        """Send one job to the worker and block until it reports back.
+
+        Returns the job's exit status and every line Blender printed while running it.
+        """
+        job = json.dumps({"argv": list(args), "cwd": str(cwd)})
+        logs: list[str] = []
+        try:
+            self._process.stdin.write(f"{job}\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return self._process.wait() or 1, logs
+
+        for line in self._process.stdout:
+            line = line.rstrip("\n")
+            if line.startswith(WORKER_RESULT_PREFIX):
+                reply = json.loads(line[len(WORKER_RESULT_PREFIX) :])
+                return int(reply.get("status", 1)), logs
+            logs.append(line)
+
+        # stdout closed before a result arrived: the worker died mid-job
+        return self._process.wait() or 1, logs
+
+    def close(self, timeout: float = 10.0) -> None:
+        if not self.alive:
+            return
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
+
+
+class BlenderWorkerPool:
+    """Fixed-size pool of persistent Blender workers.
+
+    Workers are started on first use and reused across conversions, so the
+    Blender start-up cost is paid once per worker rather than once per job.
+    Dead workers are replaced transparently.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        size: int,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        if size < 1:
+            msg = "Worker pool size must be at least 1"
+            raise ValueError(msg)
+        self._command = list(command)
+        self._env = dict(env) if env is not None else None
+        self._size = size
+        self._idle: queue.Queue[BlenderWorker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: list[BlenderWorker] = []
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def run(self, args: Sequence[str], cwd: Path) -> tuple[int, list[str]]:
+        """Run one conversion job on the next free worker."""
+        worker = self._acquire()
+        try:
+            return worker.run(args, cwd)
+        finally:
+            self._release(worker)
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+    def _acquire(self) -> BlenderWorker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._workers) < self._size:
+                worker = BlenderWorker(self._command, self._env)
+                self._workers.append(worker)
+                return worker
+
+        return self._idle.get()
+
+    def _release(self, worker: BlenderWorker) -> None:
+        if not worker.alive:
+            logger.warning("Blender worker exited; starting a replacement")
+            with self._lock:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+                worker = BlenderWorker(self._command, self._env)
+                self._workers.append(worker)
+        self._idle.put(worker)
+
+
+__all__ = [
+    "BlenderWorker",
+    "BlenderWorkerPool",
+]
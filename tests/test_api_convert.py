@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from subprocess import CompletedProcess
 from typing import Any
 
 import pytest
@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 
 from rigging_bridge.api import app
 from rigging_bridge.config import get_settings
+from rigging_bridge.services.conversion import ConversionService
 
 
 @pytest.fixture
@@ -18,14 +19,19 @@ def client() -> TestClient:
 
 @pytest.fixture
 def mock_blender(monkeypatch: pytest.MonkeyPatch):
-    def _runner(cmd: list[str], cwd: Path | None = None, **_: Any):
-        output_dir = Path(cmd[cmd.index("--output-dir") + 1])
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "UE5_sample.glb").write_bytes(b"glb")
-        return CompletedProcess(args=cmd, returncode=0, stdout="mock", stderr="")
+    class _Process:
+        def __init__(self, cmd: list[str], cwd: Path | None = None, **_: Any):
+            output_dir = Path(cmd[cmd.index("--output-dir") + 1])
+            output_dir.mkdir(parents=True, exist_ok=True)
+            (output_dir / "UE5_sample.glb").write_bytes(b"glb")
+            self.stdout = io.StringIO("mock\n")
+            self.stderr = io.StringIO("")
 
-    monkeypatch.setattr("rigging_bridge.services.conversion.subprocess.run", _runner)
-    return _runner
+        def wait(self, timeout: float | None = None) -> int:
+            return 0
+
+    monkeypatch.setattr("rigging_bridge.services.conversion.subprocess.Popen", _Process)
+    return _Process
 
 
 def test_convert_endpoint_local_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, client: TestClient, mock_blender):
@@ -36,6 +42,7 @@ def test_convert_endpoint_local_file(tmp_path: Path, monkeypatch: pytest.MonkeyP
     monkeypatch.setenv("WORK_DIR", str(work_dir))
 
     get_settings.cache_clear()  # ensure settings pick up new WORK_DIR
+    monkeypatch.setattr(client.app.state, "conversion_service", ConversionService())
 
     payload = {
         "source_uri": str(source_file),
@@ -56,3 +63,27 @@ def test_convert_endpoint_local_file(tmp_path: Path, monkeypatch: pytest.MonkeyP
     artifact_path = Path(body["artifacts"][0]["uri"])
     assert artifact_path.exists()
     assert artifact_path.suffix == ".glb"
+
+
+def test_convert_endpoint_background_job(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, client: TestClient, mock_blender):
+    source_file = tmp_path / "sample.glb"
+    source_file.write_bytes(b"dummy")
+
+    monkeypatch.setenv("WORK_DIR", str(tmp_path / "artifacts"))
+    get_settings.cache_clear()
+    monkeypatch.setattr(client.app.state, "conversion_service", ConversionService())
+
+    response = client.post("/v1/convert", json={"source_uri": str(source_file), "wait": False})
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "PENDING"
+    assert body["job_id"]
+
+    status_response = client.get(f"/v1/status/{body['job_id']}")
+    assert status_response.status_code == 200
+    job = status_response.json()
+    assert job["status"] == "COMPLETED"
+    assert Path(job["artifacts"][0]["uri"]).exists()
+
+    assert client.get("/v1/status/unknown").status_code == 404
@@ -1,20 +1,22 @@
 from __future__ import annotations
 
+import errno
+import io
+import os
+import sys
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
-from subprocess import CompletedProcess
 
 from rigging_bridge.models import ConversionRequest
 from rigging_bridge.services.conversion import ConversionService
 from rigging_bridge.config import AppSettings
 
 
-@pytest.fixture
-def fake_blender_run():
-    def _runner(cmd: list[str], cwd: Path | None = None, **_: Any):
+class FakeBlenderProcess:
+    def __init__(self, cmd: list[str], cwd: Path | None = None, **_: Any):
         try:
             output_dir_index = cmd.index("--output-dir") + 1
         except ValueError as exc:  # pragma: no cover - defensive guard
@@ -25,12 +27,19 @@ def fake_blender_run():
         artifact = output_dir / "UE5_sample.glb"
         artifact.write_bytes(b"glb")
 
-        return CompletedProcess(args=cmd, returncode=0, stdout="mock stdout", stderr="")
+        self.stdout = io.StringIO("mock stdout\n")
+        self.stderr = io.StringIO("")
+
+    def wait(self, timeout: float | None = None) -> int:
+        return 0
 
-    return _runner
+
+@pytest.fixture
+def fake_blender_process():
+    return FakeBlenderProcess
 
 
-def test_convert_local_asset(tmp_path: Path, fake_blender_run):
+def test_convert_local_asset(tmp_path: Path, fake_blender_process):
     source_file = tmp_path / "input.glb"
     source_file.write_bytes(b"dummy data")
 
@@ -38,7 +47,7 @@ def test_convert_local_asset(tmp_path: Path, fake_blender_run):
     settings = AppSettings(work_dir=work_dir)
     service = ConversionService(settings=settings)
 
-    with patch("rigging_bridge.services.conversion.subprocess.run", side_effect=fake_blender_run):
+    with patch("rigging_bridge.services.conversion.subprocess.Popen", side_effect=fake_blender_process):
         response = service.convert(ConversionRequest(source_uri=str(source_file)))
 
     assert response.status == "COMPLETED"
@@ -51,3 +60,164 @@ def test_convert_local_asset(tmp_path: Path, fake_blender_run):
     expected_artifact = settings.work_dir / "artifacts" / artifact_path.name
     assert artifact_path == expected_artifact
     assert "mock stdout" in response.logs
+
+
+FAKE_WORKER = """
+import json, os, sys
+from pathlib import Path
+
+prefix = sys.argv[1]
+for line in sys.stdin:
+    job = json.loads(line)
+    argv = job["argv"]
+    output_dir = Path(argv[argv.index("--output-dir") + 1])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "UE5_sample.glb").write_bytes(b"glb")
+    print(f"worker {os.getpid()}", flush=True)
+    print(prefix + json.dumps({"status": 0, "error": None}), flush=True)
+"""
+
+
+def test_convert_reuses_pooled_worker(tmp_path: Path):
+    from rigging_bridge.blender import WORKER_RESULT_PREFIX
+    from rigging_bridge.services.worker_pool import BlenderWorkerPool
+
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER)
+    source_file = tmp_path / "input.glb"
+    source_file.write_bytes(b"dummy data")
+
+    pool = BlenderWorkerPool([sys.executable, str(script), WORKER_RESULT_PREFIX], size=1)
+    service = ConversionService(settings=AppSettings(work_dir=tmp_path / "work"), worker_pool=pool)
+    try:
+        with patch.object(ConversionService, "_run_blender") as run:
+            first = service.convert(ConversionRequest(source_uri=str(source_file)))
+            second = service.convert(ConversionRequest(source_uri=str(source_file)))
+        run.assert_not_called()
+    finally:
+        service.close()
+
+    assert Path(first.artifacts[0].uri).exists()
+    assert first.logs == second.logs, "Both jobs should run on the same worker process"
+
+
+def test_convert_reuses_cached_output(tmp_path: Path, fake_blender_process):
+    source_file = tmp_path / "input.glb"
+    source_file.write_bytes(b"dummy data")
+
+    settings = AppSettings(work_dir=tmp_path / "work", cache_dir=tmp_path / "cache")
+    service = ConversionService(settings=settings)
+    request = ConversionRequest(source_uri=str(source_file))
+
+    with patch("rigging_bridge.services.conversion.subprocess.Popen", side_effect=fake_blender_process) as run:
+        first = service.convert(request)
+        second = service.convert(request)
+        third = service.convert(request.model_copy(update={"t_pose": False}))
+
+    assert run.call_count == 2
+    assert not first.cache_hit
+    assert second.cache_hit
+    assert not third.cache_hit
+    assert Path(second.artifacts[0].uri).read_bytes() == b"glb"
+
+
+def test_cache_key_changes_with_converter_salt(tmp_path: Path):
+    from rigging_bridge.services.cache import ConversionCache
+
+    source_file = tmp_path / "input.glb"
+    source_file.write_bytes(b"dummy data")
+    request = ConversionRequest(source_uri=str(source_file))
+
+    default_key = ConversionCache(tmp_path / "cache").key_for(source_file, request)
+    assert ConversionCache(tmp_path / "cache").key_for(source_file, request) == default_key
+
+    old_key = ConversionCache(tmp_path / "cache", salt=b"old").key_for(source_file, request)
+    new_key = ConversionCache(tmp_path / "cache", salt=b"new").key_for(source_file, request)
+    assert old_key != new_key
+    assert default_key not in (old_key, new_key)
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [
+        ("s3://bucket/path/to/file.glb", ("bucket", "path/to/file.glb")),
+        ("s3://bucket//leading/slash.glb", ("bucket", "leading/slash.glb")),
+        ("s3://bucket/", ("bucket", "")),
+        ("s3://bucket", ("bucket", "")),
+    ],
+)
+def test_split_s3_uri(uri: str, expected: tuple[str, str]):
+    from rigging_bridge.services.conversion import _split_s3_uri
+
+    assert _split_s3_uri(uri) == expected
+
+
+@pytest.mark.parametrize("uri", ["s3://", "s3:///key.glb", "https://bucket/key.glb", "bucket/key"])
+def test_split_s3_uri_rejects_invalid(uri: str):
+    from rigging_bridge.services.conversion import _split_s3_uri
+
+    with pytest.raises(ValueError, match="Invalid S3 URI"):
+        _split_s3_uri(uri)
+
+
+def test_link_or_copy_hard_links_on_one_filesystem(tmp_path: Path):
+    from rigging_bridge.services.conversion import _link_or_copy
+
+    source = tmp_path / "source.glb"
+    source.write_bytes(b"glb")
+    target = tmp_path / "target.glb"
+
+    _link_or_copy(source, target)
+
+    assert target.read_bytes() == b"glb"
+    assert target.stat().st_ino == source.stat().st_ino
+
+
+def test_link_or_copy_replaces_existing_link(tmp_path: Path):
+    from rigging_bridge.services.conversion import _link_or_copy
+
+    source = tmp_path / "source.glb"
+    source.write_bytes(b"glb")
+    target = tmp_path / "target.glb"
+
+    # A second dispatch of the same cached artifact must neither fail nor truncate it
+    _link_or_copy(source, target)
+    _link_or_copy(source, target)
+
+    assert source.read_bytes() == b"glb"
+    assert target.read_bytes() == b"glb"
+
+
+def test_link_or_copy_falls_back_to_copy(tmp_path: Path):
+    from rigging_bridge.services.conversion import _link_or_copy
+
+    source = tmp_path / "source.glb"
+    source.write_bytes(b"glb")
+    target = tmp_path / "target.glb"
+
+    cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+    with patch("rigging_bridge.services.conversion.os.link", side_effect=cross_device):
+        _link_or_copy(source, target)
+
+    assert target.read_bytes() == b"glb"
+    assert target.stat().st_ino != source.stat().st_ino
+
+
+def test_link_or_copy_never_writes_through_a_racing_link(tmp_path: Path):
+    from rigging_bridge.services.conversion import _link_or_copy
+
+    cached = tmp_path / "cached.glb"
+    cached.write_bytes(b"CACHED")
+    source = tmp_path / "source.glb"
+    source.write_bytes(b"JOB-B")
+    target = tmp_path / "target.glb"
+    # Another dispatch already linked the cached artifact to the target
+    os.link(cached, target)
+
+    with patch("rigging_bridge.services.conversion.os.link", side_effect=FileExistsError):
+        with pytest.raises(FileExistsError):
+            _link_or_copy(source, target)
+
+    assert cached.read_bytes() == b"CACHED"
+    assert source.read_bytes() == b"JOB-B"
+    assert not list(tmp_path.glob(".target.glb.*")), "Staging file left behind"
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from rigging_bridge.bridge import weight_transfer
+from rigging_bridge.bridge.weight_transfer import _falloff_weights_numpy, _nearest_indices
+
+
+def reference_falloff(points: np.ndarray, bones: np.ndarray, exponent: float) -> np.ndarray:
+    """The original float64 formula: distance ** -exponent, 1e10 within 0.001, normalized."""
+    diff = points.astype(np.float64)[:, None, :] - bones.astype(np.float64)[None, :, :]
+    distances = np.sqrt((diff * diff).sum(axis=2))
+    with np.errstate(divide="ignore", over="ignore"):
+        raw = np.where(distances > 0.001, distances ** -exponent, 1e10)
+    return raw / raw.sum(axis=1, keepdims=True)
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    return np.random.default_rng(7)
+
+
+@pytest.mark.parametrize("exponent", [1.0, 20.0])
+def test_falloff_weights_match_reference(rng: np.random.Generator, exponent: float):
+    points = rng.random((500, 3), dtype=np.float32)
+    bones = rng.random((6, 3), dtype=np.float32)
+
+    weights = _falloff_weights_numpy(points, bones, exponent)
+
+    assert weights.dtype == np.float32
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0, atol=1e-6)
+    np.testing.assert_allclose(weights, reference_falloff(points, bones, exponent), atol=1e-6)
+
+
+def test_falloff_weights_near_cutoff():
+    bones = np.array([[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]], dtype=np.float32)
+    # Inside and just outside the 0.001 cutoff of the first bone
+    points = np.array([[0.0005, 0.0, 0.0], [0.002, 0.0, 0.0]], dtype=np.float32)
+
+    weights = _falloff_weights_numpy(points, bones, 20.0)
+
+    np.testing.assert_allclose(weights, reference_falloff(points, bones, 20.0), atol=1e-6)
+
+
+def test_falloff_weights_do_not_overflow_float32():
+    # 0.005 ** -20 is about 1e46, far beyond the float32 range
+    bones = np.array([[0.0, 0.0, 0.0], [0.004, 0.0, 0.0]], dtype=np.float32)
+    points = np.array([[0.009, 0.0, 0.0], [0.0025, 0.0, 0.0]], dtype=np.float32)
+
+    weights = _falloff_weights_numpy(points, bones, 20.0)
+
+    assert np.isfinite(weights).all()
+    np.testing.assert_allclose(weights, reference_falloff(points, bones, 20.0), atol=1e-6)
+
+
+def test_nearest_indices_without_scipy(rng: np.random.Generator, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(weight_transfer, "cKDTree", None)
+    # Small blocks so the brute-force search spans several of them
+    monkeypatch.setattr(weight_transfer, "_NEAREST_BLOCK_SIZE", 64)
+    points = rng.random((1000, 3), dtype=np.float32)
+    targets = rng.random((20, 3), dtype=np.float32)
+
+    indices = _nearest_indices(points, targets)
+
+    expected = np.linalg.norm(points[:, None, :] - targets[None, :, :], axis=2).argmin(axis=1)
+    np.testing.assert_array_equal(indices, expected)
+
+
+@pytest.mark.parametrize("exponent", [1.0, 20.0])
+def test_falloff_weights_numba_matches_numpy(rng: np.random.Generator, exponent: float):
+    pytest.importorskip("numba")
+    from rigging_bridge.bridge.weight_transfer import _falloff_weights_numba
+
+    bones = rng.random((6, 3), dtype=np.float32)
+    points = np.concatenate(
+        [
+            rng.random((300, 3), dtype=np.float32),
+            # Inside and just outside the 0.001 cutoff of the first bone
+            bones[:1] + np.array([[0.0005, 0.0, 0.0], [0.002, 0.0, 0.0]], dtype=np.float32),
+            # Close enough that distance ** -20 overflows float32
+            bones[:1] + np.array([[0.009, 0.0, 0.0]], dtype=np.float32),
+        ]
+    )
+
+    weights = _falloff_weights_numba(points, bones, exponent)
+
+    assert np.isfinite(weights).all()
+    np.testing.assert_allclose(weights, _falloff_weights_numpy(points, bones, exponent), atol=1e-6)